@@ -10,37 +10,49 @@ bl_info = {
 }
 
 import bpy  # type: ignore
+import atexit
 import sys
 import threading
+from os.path import basename
 from pathlib import Path
 
 # Module-level variable to track the server thread
 mcp_server_thread = None
 # Flag to signal server to stop
 mcp_server_stop_flag = threading.Event()
+# How long stopping waits for the server thread before giving up on it
+SERVER_JOIN_TIMEOUT = 2.0
 
 # Add your project to path
 project_path = Path("/Users/gajanmohanraj/Documents/afterquery/candidate-1767282743/blender_takehome")
-if str(project_path) not in sys.path:
-    sys.path.insert(0, str(project_path))
-    print(f"Added to sys.path: {project_path}")
 
 # Add src directory to path for new structure
 src_path = project_path / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
-    print(f"Added to sys.path: {src_path}")
 
-# Add user site-packages to path (where fastmcp is installed)
-import site
-user_site = site.getusersitepackages()
-if user_site not in sys.path:
-    sys.path.insert(0, user_site)
-    print(f"Added user site-packages to sys.path: {user_site}")
 
+def add_paths_once():
+    """Put the project, src, and user site-packages (where fastmcp is installed) on sys.path"""
+    # bpy outlives addon reloads, so the flag lets a reload skip this entirely
+    if getattr(bpy, "_mcp_paths_added", False):
+        return
 
-def run_mcp_server():
-    """Run MCP server directly inside Blender (in a separate thread)"""
+    import site
+    seen = set(sys.path)
+    for path in (project_path, src_path, site.getusersitepackages()):
+        entry = str(path)
+        if entry not in seen:
+            sys.path.insert(0, entry)
+            seen.add(entry)
+            print(f"Added to sys.path: {entry}")
+
+    bpy._mcp_paths_added = True  # type: ignore[attr-defined]
+
+
+add_paths_once()
+
+
+def run_mcp_server(stop_event):
+    """Run MCP server directly inside Blender (in a separate thread) until stop_event is set"""
     print("=" * 60)
     print("MCP Server Thread Starting...")
     print(f"Python executable: {sys.executable}")
@@ -59,9 +71,9 @@ def run_mcp_server():
         print("Make sure Blender is launched from terminal or with stdout available")
         print("=" * 60)
         
-        # Run the server - this will block until stopped
+        # Run the server - this will block until stop_event is set
         # FastMCP handles JSON-RPC via stdout
-        run()
+        run(stop_event=stop_event)
         
     except ImportError as e:
         print(f"✗ Import error: {e}")
@@ -90,8 +102,7 @@ class BLENDERMCP_PT_Panel(bpy.types.Panel):
         filepath = bpy.data.filepath
         if filepath:
             # Show just the filename for cleaner display
-            import os
-            filename = os.path.basename(filepath)
+            filename = basename(filepath)
             layout.label(text=f"File: {filename}", icon='FILE_BLEND')
             # Show full path in a box (collapsed by default)
             box = layout.box()
@@ -102,14 +113,9 @@ class BLENDERMCP_PT_Panel(bpy.types.Panel):
         
         layout.separator()
         
-        # Check both property and actual thread status
-        server_running_prop = getattr(scene, 'mcp_server_running', False)
-        server_running_thread = mcp_server_thread is not None and mcp_server_thread.is_alive()
-        server_running = server_running_prop or server_running_thread
-        
-        # Sync property with actual thread status if they differ
-        if server_running_prop != server_running_thread:
-            scene.mcp_server_running = server_running_thread
+        # The property is kept in sync with the server thread by the
+        # sync_server_status timer, so draw only reads it (no thread check)
+        server_running = scene.mcp_server_running
         
         if not server_running:
             layout.operator("blendermcp.start_server", text="Connect to Claude")
@@ -132,8 +138,12 @@ class BLENDERMCP_OT_StartServer(bpy.types.Operator):
             self.report({'WARNING'}, "MCP Server already running")
             return {'CANCELLED'}
         
-        # Start server in background thread
-        mcp_server_thread = threading.Thread(target=run_mcp_server, daemon=True)
+        # Start server in background thread. It stays a daemon: the stdio
+        # reader blocks on stdin, and a non-daemon thread stuck there would
+        # hang interpreter shutdown. Clean exit goes through the stop event.
+        mcp_server_thread = threading.Thread(
+            target=run_mcp_server, args=(mcp_server_stop_flag,), daemon=True
+        )
         mcp_server_thread.start()
         
         # Update scene property
@@ -141,9 +151,8 @@ class BLENDERMCP_OT_StartServer(bpy.types.Operator):
         scene.mcp_server_running = True
         
         # Force UI to refresh
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        if context.area:
+            context.area.tag_redraw()
         
         self.report({'INFO'}, "MCP Server started - check console for output")
         return {'FINISHED'}
@@ -156,29 +165,15 @@ class BLENDERMCP_OT_StopServer(bpy.types.Operator):
     bl_description = "Stop the connection to Claude"
     
     def execute(self, context):  # type: ignore[override]
-        global mcp_server_thread, mcp_server_stop_flag
-        
-        # Signal the server to stop
-        mcp_server_stop_flag.set()
-        
-        # Wait for thread to finish (with timeout)
-        if mcp_server_thread is not None and mcp_server_thread.is_alive():
-            mcp_server_thread.join(timeout=2)
-            if mcp_server_thread.is_alive():
-                print("Warning: Server thread did not stop gracefully")
-        
-        # Reset flag and thread
-        mcp_server_stop_flag.clear()
-        mcp_server_thread = None
+        stop_server_thread()
         
         # Update scene property
         scene = context.scene
         scene.mcp_server_running = False
         
         # Force UI to refresh
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        if context.area:
+            context.area.tag_redraw()
         
         print("✓ MCP Server stopped")
         self.report({'INFO'}, "MCP Server stopped")
@@ -187,12 +182,50 @@ class BLENDERMCP_OT_StopServer(bpy.types.Operator):
 
 def update_server_status(self, context):  # type: ignore
     """Callback to refresh UI when server status changes"""
-    # Redraw all 3D viewport areas
-    if context and hasattr(context, 'screen') and context.screen:
-        for area in context.screen.areas:
+    # Redraw the area the change came from (the panel's own 3D viewport)
+    if context and context.area:
+        context.area.tag_redraw()
+        return
+    # Timer-driven changes have no area - redraw the 3D viewports instead
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
             if area.type == 'VIEW_3D':
                 area.tag_redraw()
 
+
+def sync_server_status():
+    """Timer callback: keep every scene's property in line with the server thread"""
+    server_running_thread = mcp_server_thread is not None and mcp_server_thread.is_alive()
+    for scene in bpy.data.scenes:
+        if scene.mcp_server_running != server_running_thread:  # type: ignore[attr-defined]
+            scene.mcp_server_running = server_running_thread  # type: ignore[attr-defined]
+    # Once a second is plenty for a status indicator
+    return 1.0
+
+def stop_server_thread():
+    """Signal the server thread to stop and wait (bounded) for it to exit"""
+    global mcp_server_thread, mcp_server_stop_flag
+    
+    mcp_server_stop_flag.set()
+    if mcp_server_thread is not None and mcp_server_thread.is_alive():
+        mcp_server_thread.join(timeout=SERVER_JOIN_TIMEOUT)
+        if mcp_server_thread.is_alive():
+            print("Warning: Server thread did not stop within "
+                  f"{SERVER_JOIN_TIMEOUT:.0f}s, leaving it to exit with Blender")
+    
+    # Reset flag and thread - a fresh event rather than clear(), so a
+    # thread that outlived the join still sees its own event as set
+    mcp_server_thread = None
+    mcp_server_stop_flag = threading.Event()
+
+
+def signal_server_stop():
+    """Exit hook: tell the server thread to stop without waiting for it"""
+    # The thread is a daemon, so it can't hold up Blender quitting - joining
+    # here would only add a stall to every quit
+    mcp_server_stop_flag.set()
+
+
 def register():
     # Register properties with update callback
     bpy.types.Scene.mcp_server_running = bpy.props.BoolProperty(  # type: ignore[attr-defined]
@@ -205,18 +238,22 @@ def register():
     bpy.utils.register_class(BLENDERMCP_PT_Panel)
     bpy.utils.register_class(BLENDERMCP_OT_StartServer)
     bpy.utils.register_class(BLENDERMCP_OT_StopServer)
+    
+    # Reconcile the status property off the draw path
+    bpy.app.timers.register(sync_server_status, first_interval=1.0, persistent=True)
+    
+    # Blender doesn't unregister add-ons on quit, so signal the server at exit too
+    atexit.register(signal_server_stop)
 
 
 def unregister():
-    global mcp_server_thread, mcp_server_stop_flag
-    
     # Stop the server if it's running
-    mcp_server_stop_flag.set()
-    if mcp_server_thread is not None and mcp_server_thread.is_alive():
-        mcp_server_thread.join(timeout=2)
+    stop_server_thread()
+    atexit.unregister(signal_server_stop)
     
-    mcp_server_thread = None
-    mcp_server_stop_flag.clear()
+    # Stop the status timer
+    if bpy.app.timers.is_registered(sync_server_status):
+        bpy.app.timers.unregister(sync_server_status)
     
     # Unregister classes
     bpy.utils.unregister_class(BLENDERMCP_PT_Panel)
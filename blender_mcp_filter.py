@@ -8,232 +8,237 @@ This script:
 3. Only forwards valid JSON-RPC messages to stdout
 """
 
-import subprocess
+import asyncio
+import codecs
+import os
+import signal
 import sys
 import json
-import select
-import os
-import time
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; json.raw_decode handles everything alone
+    orjson = None
+
 script_dir = Path(__file__).parent
 blender_path = "/Applications/Blender.app/Contents/MacOS/Blender"
 server_script = script_dir / "blender_mcp_server.py"
 
-# Start Blender with the server script
-# Use --python-exit-code to ensure errors are caught
-# Note: Running WITHOUT --background so you can see changes in real-time
-# The filter will still clean stdout for JSON-RPC
-process = subprocess.Popen(
-    [
-        blender_path,
-        "--python-exit-code", "1",
-        "--python", str(server_script),
-    ],
-    stdout=subprocess.PIPE,
-    stderr=subprocess.PIPE,
-    text=False,  # Use binary mode for more control
-    bufsize=0,  # Unbuffered
-)
-
-# On macOS, try to bring Blender window to front after launch
-# Wait a bit for Blender to start, then activate it
-if sys.platform == "darwin":
-    def bring_blender_to_front():
-        """Bring Blender window to front on macOS with polling"""
-        # Poll for Blender process to be ready (up to 10 seconds)
-        max_wait = 10
-        check_interval = 0.5
-        waited = 0
-        
-        while waited < max_wait:
-            try:
-                # Check if Blender process exists
-                result = subprocess.run(
-                    ["pgrep", "-f", "Blender"],
-                    capture_output=True,
-                    timeout=1
-                )
-                if result.returncode == 0:
-                    # Blender process exists, wait a bit more for window
-                    time.sleep(1)
-                    # Try to activate Blender
-                    subprocess.run(
-                        ["osascript", "-e", 'tell application "Blender" to activate'],
-                        capture_output=True,
-                        timeout=2
-                    )
-                    # Try multiple times to ensure window comes to front
-                    for _ in range(3):
-                        time.sleep(0.5)
-                        subprocess.run(
-                            ["osascript", "-e", 'tell application "Blender" to activate'],
-                            capture_output=True,
-                            timeout=1
-                        )
-                    break
-            except Exception:
-                # If check fails, continue waiting
-                pass
-            
-            time.sleep(check_interval)
-            waited += check_interval
-    
-    # Run in background thread so it doesn't block
-    import threading
-    threading.Thread(target=bring_blender_to_front, daemon=True).start()
+ACTIVATE_SCRIPT = 'tell application "Blender" to activate'
 
-def is_json_line(line_bytes):
-    """Check if a line contains valid JSON"""
-    try:
-        line = line_bytes.decode('utf-8', errors='ignore').strip()
-        if not line:
-            return False
-        # JSON-RPC messages are JSON objects
-        if line.startswith(('{', '[')):
-            json.loads(line)
-            return True
-    except (json.JSONDecodeError, UnicodeDecodeError):
-        pass
-    return False
-
-def filter_stdout():
+# Bytes requested per pipe read; large reads drain a busy pipe in few wakeups
+READ_SIZE = 1 << 16
+
+# Seconds Blender gets to exit after SIGTERM before it is killed
+TERMINATE_GRACE = 1.0
+
+async def _run_quietly(*args: str) -> int:
+    """Run a helper command with its output discarded, returning its exit code"""
+    helper = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    return await helper.wait()
+
+# Shared decoder for raw_decode scanning and the decoded stdout text.
+# _pending_pos marks the first unconsumed character; consumed text is only
+# sliced off once it makes up half the buffer, so each message isn't a copy.
+_decoder = json.JSONDecoder()
+_pending = ""
+_pending_pos = 0
+
+# Unconsumed text beyond this size is a runaway fragment, not a message
+MAX_PENDING = 1 << 20
+
+# Set while the rest of a dropped oversized line is still arriving; output
+# is discarded until its terminating newline
+_discarding = False
+
+# Incremental decoder keeps multi-byte characters split across reads intact
+_utf8 = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+
+async def filter_stdout(stream: asyncio.StreamReader) -> None:
     """Read from process stdout and filter out non-JSON output"""
-    if process.stdout is None:
-        return
+    global _pending, _discarding
     
-    buffer = bytearray()
-    
-    while True:
-        # Read available data
-        try:
-            data = process.stdout.read(4096)
-        except (OSError, ValueError):
-            data = b''
+    while data := await stream.read(READ_SIZE):
+        # Skip the remainder of a dropped line, up to and including its newline
+        if _discarding:
+            newline = data.find(b'\n')
+            if newline == -1:
+                continue
+            data = data[newline + 1:]
+            _discarding = False
+            _utf8.reset()
         
-        if not data:
-            # Check if process ended
-            if process.poll() is not None:
-                # Process ended - try to output any remaining JSON
-                if buffer:
-                    try:
-                        text = buffer.decode('utf-8', errors='ignore').strip()
-                        if text.startswith(('{', '[')):
-                            json.loads(text)  # Validate
-                            sys.stdout.buffer.write(buffer)
-                            sys.stdout.buffer.flush()
-                    except (json.JSONDecodeError, UnicodeDecodeError):
-                        pass
-                break
-            # No data available, but process still running
-            # Try to extract JSON from current buffer
-            _extract_json_from_buffer(buffer)
-            # Wait a bit before checking again
-            import time
-            time.sleep(0.01)
+        # Banner/log chunks with no JSON start and no partial message pending
+        # can be dropped on the raw bytes, without decoding them at all
+        if _pending_pos == len(_pending) and b'{' not in data and b'[' not in data:
+            _utf8.reset()
             continue
         
-        buffer.extend(data)
+        _pending += _utf8.decode(data)
         
-        # Continuously try to extract JSON from buffer
-        _extract_json_from_buffer(buffer)
+        # Extract every complete JSON message decoded so far
+        _extract_json_from_buffer()
         
         # Prevent buffer from growing too large
-        if len(buffer) > 100000:  # 100KB limit
-            buffer = bytearray()
+        if len(_pending) - _pending_pos > MAX_PENDING:
+            _drop_runaway_fragment()
+            _extract_json_from_buffer()
+    
+    # Process closed stdout - output any remaining complete JSON
+    _pending += _utf8.decode(b'', final=True)
+    _extract_json_from_buffer(final=True)
+
+def _find_json_start(text: str, pos: int) -> int:
+    """Return the index of the next '{' or '[' at or after pos, or -1"""
+    brace = text.find('{', pos)
+    bracket = text.find('[', pos)
+    if brace == -1:
+        return bracket
+    if bracket == -1:
+        return brace
+    return min(brace, bracket)
 
-def _extract_json_from_buffer(buffer: bytearray) -> None:
-    """Extract and output complete JSON objects from buffer"""
-    if not buffer:
-        return
+def _whole_line_end(text: str, start: int, newline: int) -> int:
+    """Return the end of a message filling the line from start, or -1
     
+    Uses orjson when installed - the common case is one message per line,
+    which it validates several times faster than the stdlib decoder.
+    """
+    if orjson is None or newline == -1:
+        return -1
+    candidate = text[start:newline].rstrip()
     try:
-        text = buffer.decode('utf-8', errors='ignore')
-    except (UnicodeDecodeError, ValueError):
-        return
+        orjson.loads(candidate)
+    except orjson.JSONDecodeError:
+        return -1
+    return start + len(candidate)
+
+def _extract_json_from_buffer(final: bool = False) -> None:
+    """Extract and output complete JSON objects from the pending text
     
-    # Look for JSON object start
-    start_idx = text.find('{')
-    if start_idx == -1:
-        start_idx = text.find('[')
-        if start_idx == -1:
-            # No JSON found, clear buffer if it's getting large
-            if len(buffer) > 1000:
-                buffer.clear()
-            return
+    JSON-RPC messages are newline-terminated, so text after the last newline
+    is still being written and isn't handed to the parser until it completes
+    (or the stream ends, when final is set).
+    """
+    global _pending, _pending_pos
+    text = _pending
+    start = _find_json_start(text, _pending_pos)
+    newline = -1
     
-    # Remove non-JSON content before the JSON start
-    if start_idx > 0:
-        del buffer[:start_idx]
-        text = text[start_idx:]
-        start_idx = 0
+    while start != -1:
+        # Cheap C-level completeness check before attempting a parse
+        if newline < start:
+            newline = text.find('\n', start)
+            if newline == -1 and not final:
+                break
+        end = _whole_line_end(text, start, newline)
+        if end == -1:
+            try:
+                _, end = _decoder.raw_decode(text, start)
+            except json.JSONDecodeError as e:
+                # A decode error with no newline after it is a message still
+                # being written - keep it
+                if text.find('\n', e.pos) == -1:
+                    break
+                # Otherwise it's garbage (e.g. banner text) - skip past this brace
+                start = _find_json_start(text, start + 1)
+                continue
+        
+        # Found valid JSON! Output it with newline
+        sys.stdout.buffer.write(text[start:end].encode('utf-8') + b'\n')
+        sys.stdout.buffer.flush()
+        start = _find_json_start(text, end)
     
-    # Try to find complete JSON using a smarter approach
-    # JSON-RPC messages are typically on a single line, so check for newlines first
-    newline_idx = text.find('\n', start_idx)
-    if newline_idx != -1:
-        # Try to parse JSON up to the newline
-        try:
-            json_str = text[start_idx:newline_idx].strip()
-            if json_str.startswith(('{', '[')):
-                json.loads(json_str)
-                # Found valid JSON! Output it with newline
-                json_bytes = (json_str + '\n').encode('utf-8')
-                sys.stdout.buffer.write(json_bytes)
-                sys.stdout.buffer.flush()
-                # Remove processed JSON from buffer (including newline)
-                del buffer[:newline_idx + 1]
-                # Recursively check for more JSON
-                _extract_json_from_buffer(buffer)
-                return
-        except json.JSONDecodeError:
-            pass
+    # Advance past everything consumed; an incomplete message (if any) remains
+    _pending_pos = start if start != -1 else len(text)
     
-    # If no newline, try to parse the entire remaining text as JSON
-    # This handles JSON-RPC messages that don't end with newlines
-    try:
-        json_str = text[start_idx:].strip()
-        if json_str.startswith(('{', '[')):
-            json.loads(json_str)
-            # Found valid JSON! Output it
-            json_bytes = json_str.encode('utf-8')
-            sys.stdout.buffer.write(json_bytes)
-            sys.stdout.buffer.flush()
-            # Remove processed JSON from buffer
-            buffer.clear()
-            return
-    except json.JSONDecodeError:
-        # Not complete JSON yet, keep buffering
-        pass
-
-def forward_stderr():
-    """Read from process stderr and forward to stderr"""
-    if process.stderr is None:
-        return
+    # Compact once the consumed prefix dominates the buffer
+    if _pending_pos > len(text) // 2:
+        _pending = text[_pending_pos:]
+        _pending_pos = 0
+
+def _drop_runaway_fragment() -> None:
+    """Discard unconsumed text through the end of its line
     
-    while True:
-        data = process.stderr.read(4096)
-        if not data:
-            if process.poll() is not None:
-                break
-            continue
+    Resuming at the next brace instead would land inside the same oversized
+    message, and a nested object from it could be forwarded as a message of
+    its own. If the line hasn't ended yet, the rest of it is discarded as it
+    arrives.
+    """
+    global _pending, _pending_pos, _discarding
+    newline = _pending.find('\n', _pending_pos)
+    end = len(_pending) if newline == -1 else newline + 1
+    _discarding = newline == -1
+    sys.stderr.write(
+        f"blender_mcp_filter: dropped {end - _pending_pos} characters "
+        f"of an oversized line{' (discarding the rest)' if _discarding else ''}\n"
+    )
+    sys.stderr.flush()
+    _pending = _pending[end:]
+    _pending_pos = 0
+
+async def forward_stderr(stream: asyncio.StreamReader) -> None:
+    """Read from process stderr and forward to stderr"""
+    activate_task = None
+    while data := await stream.read(READ_SIZE):
+        # On macOS, bring Blender's window to front once it first reports in
+        # (keep a reference so the task isn't garbage collected mid-flight)
+        if activate_task is None and sys.platform == "darwin":
+            activate_task = asyncio.create_task(
+                _run_quietly("osascript", "-e", ACTIVATE_SCRIPT)
+            )
         sys.stderr.buffer.write(data)
         sys.stderr.buffer.flush()
 
-import threading
-
-# Start threads to handle stdout and stderr
-stdout_thread = threading.Thread(target=filter_stdout, daemon=True)
-stderr_thread = threading.Thread(target=forward_stderr, daemon=True)
-
-stdout_thread.start()
-stderr_thread.start()
-
-# Wait for process to finish
-exit_code = process.wait()
+async def _terminate(process: asyncio.subprocess.Process) -> None:
+    """Stop Blender's whole process group: SIGTERM, then SIGKILL after a grace period"""
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+        try:
+            await asyncio.wait_for(process.wait(), TERMINATE_GRACE)
+        except asyncio.TimeoutError:
+            os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass  # Already gone
 
-# Wait for threads to finish
-stdout_thread.join(timeout=2)
-stderr_thread.join(timeout=2)
+async def main() -> int:
+    """Run Blender and pump its output until it exits, returning its exit code"""
+    # Start Blender with the server script
+    # Use --python-exit-code to ensure errors are caught
+    # Note: Running WITHOUT --background so you can see changes in real-time
+    # The filter will still clean stdout for JSON-RPC
+    process = await asyncio.create_subprocess_exec(
+        blender_path,
+        "--python-exit-code", "1",
+        "--python", str(server_script),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        # Own session/process group, so shutdown reaches anything Blender spawned
+        start_new_session=True,
+    )
+    assert process.stdout is not None and process.stderr is not None
+    
+    # When the client stops us, take Blender down with us instead of orphaning it
+    loop = asyncio.get_running_loop()
+    terminating: set[asyncio.Task[None]] = set()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(
+            sig, lambda: terminating.add(asyncio.create_task(_terminate(process)))
+        )
+    
+    # Pump both pipes on this one event loop until Blender closes them
+    await asyncio.gather(
+        filter_stdout(process.stdout),
+        forward_stderr(process.stderr),
+    )
+    
+    # Wait for process to finish
+    return await process.wait()
 
-sys.exit(exit_code)
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -10,32 +10,18 @@ from pathlib import Path
 # Redirect stdout to stderr BEFORE any imports or code execution
 
 _original_stdout = sys.stdout
-_original_stderr = sys.stderr
 
 # Redirect stdout to stderr immediately to catch all output
 # This includes Blender banner, print statements, etc.
+# print() and sys.stdout.write both resolve sys.stdout at call time, so this
+# one assignment covers them - no per-call wrappers needed
+sys.stdout.flush()
 sys.stdout = sys.stderr
 
-# Monkey-patch print to ensure nothing goes to stdout
-# This catches prints from imported modules too
-_original_print = __builtins__.get('print', print)
-def safe_print(*args, **kwargs):
-    """Redirect all print calls to stderr"""
-    if 'file' not in kwargs:
-        kwargs['file'] = sys.stderr
-    _original_print(*args, **kwargs)
-__builtins__['print'] = safe_print
-
-# Also redirect sys.stdout.write to stderr
-# Store original write method before redirecting stdout
-_original_stdout_write = sys.stdout.write
-_original_stderr_write = sys.stderr.write
-
-def safe_stdout_write(s: str) -> int:
-    """Redirect stdout.write to stderr, avoiding recursion"""
-    # Use the original stderr.write to avoid any potential recursion
-    return _original_stderr_write(s)
-sys.stdout.write = safe_stdout_write
+# C extensions and child processes write to fd 1 directly, bypassing
+# sys.stdout - point fd 1 at stderr too, keeping a duplicate to restore
+_saved_stdout_fd = os.dup(1)
+os.dup2(2, 1)
 
 try:
     # Add src to path (silently - output goes to stderr)
@@ -49,9 +35,9 @@ try:
     
     # Restore stdout for FastMCP (it handles JSON-RPC via stdout)
     # FastMCP will handle all JSON-RPC communication properly
+    os.dup2(_saved_stdout_fd, 1)
+    os.close(_saved_stdout_fd)
     sys.stdout = _original_stdout
-    sys.stdout.write = _original_stdout_write
-    __builtins__['print'] = _original_print
     
     # Run the MCP server
     # FastMCP will use stdout for JSON-RPC messages
@@ -1,10 +1,106 @@
 """Pydantic models for input validation"""
 
-from pydantic import BaseModel, Field, field_validator
-from typing import Tuple, Optional, Literal
+import re
 
+from pydantic import AfterValidator, BaseModel, BeforeValidator, ConfigDict, Field, StrictStr
+from typing import Annotated, Any, Dict, NotRequired, Tuple, TypedDict, Optional, Literal, Self
 
-class CreateCubeInput(BaseModel):
+
+# Characters that can't appear in object names - checked with one
+# precompiled regex search rather than a Python loop per character
+_INVALID_NAME_CHARS = '/\\:*?"<>|'
+_INVALID_NAME_RE = re.compile(f"[{re.escape(_INVALID_NAME_CHARS)}]")
+_INVALID_NAME_MESSAGE = f"Name cannot contain: {', '.join(_INVALID_NAME_CHARS)}"
+
+
+def _check_name(v: str) -> str:
+    """Ensure name doesn't contain invalid characters"""
+    if _INVALID_NAME_RE.search(v):
+        raise ValueError(_INVALID_NAME_MESSAGE)
+    return v.strip()
+
+
+# Text fields are StrictStr throughout - MCP always delivers str, so skip lax
+# coercion. DataName refers to a datablock by name (1-63 characters, Blender's
+# limit); NewName also rejects characters that can't appear in a new name.
+DataName = Annotated[StrictStr, Field(min_length=1, max_length=63)]
+NewName = Annotated[DataName, AfterValidator(_check_name)]
+
+# File extension checks, case-insensitive without lowercasing the whole path
+_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.exr')
+_IMAGE_EXT_RE = re.compile(r"\.(?:png|jpe?g|bmp|tiff|exr)\Z", re.IGNORECASE)
+_IMAGE_EXT_MESSAGE = f"Filepath must end with one of: {', '.join(_IMAGE_EXTENSIONS)}"
+_BLEND_EXT_RE = re.compile(r"\.blend\Z", re.IGNORECASE)
+_BLEND_EXT_MESSAGE = "Filepath must end with .blend extension"
+
+
+def _check_image_path(v: str) -> str:
+    """Ensure filepath has a valid image extension"""
+    if not _IMAGE_EXT_RE.search(v):
+        raise ValueError(_IMAGE_EXT_MESSAGE)
+    return v
+
+
+def _check_blend_path(v: str) -> str:
+    """Ensure filepath ends with .blend"""
+    if not _BLEND_EXT_RE.search(v):
+        raise ValueError(_BLEND_EXT_MESSAGE)
+    return v.strip()
+
+
+# Render output and .blend file paths
+ImagePath = Annotated[StrictStr, Field(min_length=1), AfterValidator(_check_image_path)]
+BlendPath = Annotated[StrictStr, Field(min_length=1), AfterValidator(_check_blend_path)]
+
+
+def _uppercase(v: object) -> object:
+    """Accept any case - the Literal itself is checked by pydantic-core"""
+    return v.upper() if isinstance(v, str) else v
+
+
+# Light type, matched case-insensitively
+LightType = Annotated[Literal['SUN', 'POINT', 'SPOT', 'AREA'], BeforeValidator(_uppercase)]
+
+
+# Bounded vector types. The bounds sit on each component as Field constraints,
+# so pydantic-core checks them natively without calling back into Python.
+Coordinate = Annotated[float, Field(ge=-10000.0, le=10000.0)]
+Angle = Annotated[float, Field(ge=-6.28318, le=6.28318)]  # ±2π radians
+ColorChannel = Annotated[float, Field(ge=0.0, le=1.0)]
+ScaleFactor = Annotated[float, Field(ge=0.0, le=1000.0)]
+PositiveScaleFactor = Annotated[float, Field(gt=0.0, le=1000.0)]
+
+BoundedVector3 = Tuple[Coordinate, Coordinate, Coordinate]
+Location = BoundedVector3
+Rotation = Tuple[Angle, Angle, Angle]
+Color = Tuple[ColorChannel, ColorChannel, ColorChannel]
+Scale = Tuple[ScaleFactor, ScaleFactor, ScaleFactor]
+PositiveScale = Tuple[PositiveScaleFactor, PositiveScaleFactor, PositiveScaleFactor]
+
+
+class InputModel(BaseModel):
+    """
+    Base class for all tool input models.
+    
+    Inputs are immutable once validated and reject unknown fields, so a
+    typo'd parameter fails loudly instead of being silently ignored.
+    Validators are built on first use (or by warm_up()), not at import.
+    """
+    
+    model_config = ConfigDict(frozen=True, extra='forbid', defer_build=True)
+    
+    @classmethod
+    def trusted(cls, **values) -> Self:
+        """
+        Build an instance WITHOUT validation, via model_construct.
+        
+        Only for values that already came out of a validated instance (e.g.
+        re-dispatching a request). Never call this with client-supplied input.
+        """
+        return cls.model_construct(**values)
+
+
+class CreateCubeInput(InputModel):
     """
     Input model for creating a cube in Blender.
 
@@ -12,10 +108,8 @@ class CreateCubeInput(BaseModel):
     when validation fails. This ensures the tool receives valid data.
     """
     
-    name: str = Field(
+    name: NewName = Field(
         description="Name for the cube object (1-63 characters)",
-        min_length=1,
-        max_length=63,
     )
     
     size: float = Field(
@@ -25,31 +119,13 @@ class CreateCubeInput(BaseModel):
         le=1000.0,
     )
     
-    location: Tuple[float, float, float] = Field(
+    location: Location = Field(
         default=(0.0, 0.0, 0.0),
         description="Location of the cube in 3D space (x, y, z)",
     )
-    
-    @field_validator("location")
-    @classmethod
-    def validate_location(cls, v: Tuple[float, float, float]) -> Tuple[float, float, float]:
-        """Ensure location coordinates are within reasonable bounds"""
-        limit = 10000.0
-        x, y, z = v
-        if not all(-limit <= coord <= limit for coord in (x, y, z)):
-            raise ValueError(f"Location coordinates must be within ±{limit}")
-        return v
-    
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Ensure name doesn't contain invalid characters"""
-        invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-        if any(char in v for char in invalid_chars):
-            raise ValueError(f"Name cannot contain: {', '.join(invalid_chars)}")
-        return v.strip()
-
-class CreateSphereInput(BaseModel):
+
+
+class CreateSphereInput(InputModel):
     """
     Input model for creating a UV sphere in Blender.
     
@@ -57,10 +133,8 @@ class CreateSphereInput(BaseModel):
     Matches Blender's bpy.ops.mesh.primitive_uv_sphere_add() API.
     """
     
-    name: str = Field(
+    name: NewName = Field(
         description="Name for the sphere object (1-63 characters)",
-        min_length=1,
-        max_length=63,
     )
     
     segments: int = Field(
@@ -99,206 +173,148 @@ class CreateSphereInput(BaseModel):
         description="Alignment of the new object: WORLD (world axes), VIEW (view orientation), or CURSOR (3D cursor orientation)",
     )
     
-    location: Tuple[float, float, float] = Field(
+    location: BoundedVector3 = Field(
         default=(0.0, 0.0, 0.0),
         description="Location of the sphere in 3D space (x, y, z)",
     )
     
-    rotation: Tuple[float, float, float] = Field(
+    rotation: BoundedVector3 = Field(
         default=(0.0, 0.0, 0.0),
         description="Rotation of the sphere in Euler angles (x, y, z) in radians",
     )
     
-    scale: Tuple[float, float, float] = Field(
+    scale: Scale = Field(
         default=(1.0, 1.0, 1.0),
         description="Scale of the sphere (x, y, z). Default is (1.0, 1.0, 1.0) for uniform scaling",
     )
-    
-    @field_validator("location", "rotation")
-    @classmethod
-    def validate_vector3(cls, v: Tuple[float, float, float]) -> Tuple[float, float, float]:
-        """Ensure 3D vector coordinates are within reasonable bounds"""
-        limit = 10000.0
-        x, y, z = v
-        if not all(-limit <= coord <= limit for coord in (x, y, z)):
-            raise ValueError(f"Vector coordinates must be within ±{limit}")
-        return v
-    
-    @field_validator("scale")
-    @classmethod
-    def validate_scale(cls, v: Tuple[float, float, float]) -> Tuple[float, float, float]:
-        """Validate scale values"""
-        x, y, z = v
-        # Scale can be 0.0 (default) or positive values
-        if not all(coord >= 0.0 for coord in (x, y, z)):
-            raise ValueError("Scale values must be >= 0.0")
-        if not all(coord <= 1000.0 for coord in (x, y, z)):
-            raise ValueError("Scale values must be <= 1000.0")
-        return v
-    
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Ensure name doesn't contain invalid characters"""
-        invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-        if any(char in v for char in invalid_chars):
-            raise ValueError(f"Name cannot contain: {', '.join(invalid_chars)}")
-        return v.strip()
 
 
-class MoveObjectInput(BaseModel):
+class MoveObjectInput(InputModel):
     """Input model for moving an object"""
     
-    name: str = Field(
+    name: DataName = Field(
         description="Name of the object to move",
-        min_length=1,
-        max_length=63,
     )
     
-    location: Tuple[float, float, float] = Field(
+    location: Location = Field(
         description="New location in 3D space (x, y, z)",
     )
+
+
+class MoveObjectsInput(InputModel):
+    """Input model for moving several objects in one call"""
     
-    @field_validator("location")
-    @classmethod
-    def validate_location(cls, v: Tuple[float, float, float]) -> Tuple[float, float, float]:
-        """Ensure location coordinates are within reasonable bounds"""
-        limit = 10000.0
-        x, y, z = v
-        if not all(-limit <= coord <= limit for coord in (x, y, z)):
-            raise ValueError(f"Location coordinates must be within ±{limit}")
-        return v
+    moves: Tuple[Tuple[DataName, Location], ...] = Field(
+        min_length=1,
+        max_length=10000,
+        description="(name, (x, y, z)) pairs, one per object to move",
+    )
 
 
-class DeleteObjectInput(BaseModel):
+class DeleteObjectInput(InputModel):
     """Input model for deleting an object"""
     
-    name: str = Field(
+    name: DataName = Field(
         description="Name of the object to delete",
-        min_length=1,
-        max_length=63,
     )
 
 
-class SelectObjectInput(BaseModel):
+class SelectObjectInput(InputModel):
     """Input model for selecting an object"""
     
-    name: str = Field(
+    name: DataName = Field(
         description="Name of the object to select",
-        min_length=1,
-        max_length=63,
     )
 
 
-class CreateMaterialInput(BaseModel):
+class CreateMaterialInput(InputModel):
     """Input model for creating a material"""
     
-    name: str = Field(
+    name: DataName = Field(
         description="Name for the material (1-63 characters)",
-        min_length=1,
-        max_length=63,
     )
     
-    color: Tuple[float, float, float] = Field(
+    color: Color = Field(
         default=(0.8, 0.8, 0.8),
         description="RGB color values (0.0 to 1.0)",
     )
-    
-    @field_validator("color")
-    @classmethod
-    def validate_color(cls, v: Tuple[float, float, float]) -> Tuple[float, float, float]:
-        """Ensure color values are between 0 and 1"""
-        r, g, b = v
-        if not all(0.0 <= val <= 1.0 for val in (r, g, b)):
-            raise ValueError("Color values must be between 0.0 and 1.0")
-        return v
 
 
-class AssignMaterialInput(BaseModel):
+class AssignMaterialInput(InputModel):
     """Input model for assigning a material to an object"""
     
-    object_name: str = Field(
+    object_name: DataName = Field(
         description="Name of the object",
-        min_length=1,
-        max_length=63,
     )
     
-    material_name: str = Field(
+    material_name: DataName = Field(
         description="Name of the material to assign",
-        min_length=1,
-        max_length=63,
     )
 
 
-class RotateObjectInput(BaseModel):
+class RotateObjectInput(InputModel):
     """Input model for rotating an object"""
     
-    name: str = Field(
+    name: DataName = Field(
         description="Name of the object to rotate",
-        min_length=1,
-        max_length=63,
     )
     
-    rotation: Tuple[float, float, float] = Field(
+    rotation: Rotation = Field(
         description="Rotation in radians (x, y, z) - Euler angles",
     )
-    
-    @field_validator("rotation")
-    @classmethod
-    def validate_rotation(cls, v: Tuple[float, float, float]) -> Tuple[float, float, float]:
-        """Ensure rotation values are reasonable (within ±2π range)"""
-        limit = 6.28318  # 2 * pi
-        x, y, z = v
-        if not all(-limit <= coord <= limit for coord in (x, y, z)):
-            raise ValueError(f"Rotation values should be within ±{limit} radians (approximately ±360 degrees)")
-        return v
 
 
-class ScaleObjectInput(BaseModel):
+class ScaleObjectInput(InputModel):
     """Input model for scaling an object"""
     
-    name: str = Field(
+    name: DataName = Field(
         description="Name of the object to scale",
-        min_length=1,
-        max_length=63,
     )
     
-    scale: Tuple[float, float, float] = Field(
+    scale: PositiveScale = Field(
         description="Scale factors (x, y, z) - must be positive",
     )
+
+
+class TransformObjectInput(InputModel):
+    """Input model for setting an object's location, rotation and scale in one call"""
+    
+    name: DataName = Field(
+        description="Name of the object to transform",
+    )
     
-    @field_validator("scale")
-    @classmethod
-    def validate_scale(cls, v: Tuple[float, float, float]) -> Tuple[float, float, float]:
-        """Ensure scale values are positive and reasonable"""
-        x, y, z = v
-        if not all(val > 0.0 for val in (x, y, z)):
-            raise ValueError("Scale values must be positive (greater than 0)")
-        if not all(val <= 1000.0 for val in (x, y, z)):
-            raise ValueError("Scale values must be <= 1000.0")
-        return v
+    location: Optional[Location] = Field(
+        default=None,
+        description="New location in 3D space (x, y, z), or None to leave it",
+    )
+    
+    rotation: Optional[Rotation] = Field(
+        default=None,
+        description="Rotation in radians (x, y, z) - Euler angles, or None to leave it",
+    )
+    
+    scale: Optional[PositiveScale] = Field(
+        default=None,
+        description="Scale factors (x, y, z) - must be positive, or None to leave it",
+    )
 
 
-class GetObjectInfoInput(BaseModel):
+class GetObjectInfoInput(InputModel):
     """Input model for getting object information"""
     
-    name: str = Field(
+    name: DataName = Field(
         description="Name of the object to get information about",
-        min_length=1,
-        max_length=63,
     )
 
 
-class CreateCameraInput(BaseModel):
+class CreateCameraInput(InputModel):
     """Input model for creating a camera"""
     
-    name: str = Field(
+    name: NewName = Field(
         description="Name for the camera object (1-63 characters)",
-        min_length=1,
-        max_length=63,
     )
     
-    location: Tuple[float, float, float] = Field(
+    location: Location = Field(
         default=(0.0, 0.0, 5.0),
         description="Location of the camera in 3D space (x, y, z)",
     )
@@ -307,42 +323,21 @@ class CreateCameraInput(BaseModel):
         default=(0.0, 0.0, 0.0),
         description="Rotation in radians (x, y, z) - Euler angles",
     )
-    
-    @field_validator("location")
-    @classmethod
-    def validate_location(cls, v: Tuple[float, float, float]) -> Tuple[float, float, float]:
-        """Ensure location coordinates are within reasonable bounds"""
-        limit = 10000.0
-        x, y, z = v
-        if not all(-limit <= coord <= limit for coord in (x, y, z)):
-            raise ValueError(f"Location coordinates must be within ±{limit}")
-        return v
-    
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Ensure name doesn't contain invalid characters"""
-        invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-        if any(char in v for char in invalid_chars):
-            raise ValueError(f"Name cannot contain: {', '.join(invalid_chars)}")
-        return v.strip()
 
 
-class CreateLightInput(BaseModel):
+class CreateLightInput(InputModel):
     """Input model for creating a light"""
     
-    name: str = Field(
+    name: NewName = Field(
         description="Name for the light object (1-63 characters)",
-        min_length=1,
-        max_length=63,
     )
     
-    light_type: str = Field(
+    light_type: LightType = Field(
         default="SUN",
         description="Type of light: SUN, POINT, SPOT, or AREA",
     )
     
-    location: Tuple[float, float, float] = Field(
+    location: Location = Field(
         default=(0.0, 0.0, 10.0),
         description="Location of the light in 3D space (x, y, z)",
     )
@@ -353,42 +348,13 @@ class CreateLightInput(BaseModel):
         ge=0.0,
         le=1000.0,
     )
-    
-    @field_validator("light_type")
-    @classmethod
-    def validate_light_type(cls, v: str) -> str:
-        """Ensure light type is valid"""
-        valid_types = ["SUN", "POINT", "SPOT", "AREA"]
-        if v.upper() not in valid_types:
-            raise ValueError(f"Light type must be one of: {', '.join(valid_types)}")
-        return v.upper()
-    
-    @field_validator("location")
-    @classmethod
-    def validate_location(cls, v: Tuple[float, float, float]) -> Tuple[float, float, float]:
-        """Ensure location coordinates are within reasonable bounds"""
-        limit = 10000.0
-        x, y, z = v
-        if not all(-limit <= coord <= limit for coord in (x, y, z)):
-            raise ValueError(f"Location coordinates must be within ±{limit}")
-        return v
-    
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Ensure name doesn't contain invalid characters"""
-        invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-        if any(char in v for char in invalid_chars):
-            raise ValueError(f"Name cannot contain: {', '.join(invalid_chars)}")
-        return v.strip()
 
 
-class RenderSceneInput(BaseModel):
+class RenderSceneInput(InputModel):
     """Input model for rendering a scene"""
     
-    filepath: str = Field(
+    filepath: ImagePath = Field(
         description="File path to save the rendered image (e.g., '/path/to/image.png')",
-        min_length=1,
     )
     
     resolution_x: int = Field(
@@ -404,24 +370,13 @@ class RenderSceneInput(BaseModel):
         ge=1,
         le=10000,
     )
-    
-    @field_validator("filepath")
-    @classmethod
-    def validate_filepath(cls, v: str) -> str:
-        """Ensure filepath has a valid image extension"""
-        valid_extensions = ['.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.exr']
-        if not any(v.lower().endswith(ext) for ext in valid_extensions):
-            raise ValueError(f"Filepath must end with one of: {', '.join(valid_extensions)}")
-        return v
 
 
-class CreateCylinderInput(BaseModel):
+class CreateCylinderInput(InputModel):
     """Input model for creating a cylinder in Blender"""
     
-    name: str = Field(
+    name: NewName = Field(
         description="Name for the cylinder object (1-63 characters)",
-        min_length=1,
-        max_length=63,
     )
     
     radius: float = Field(
@@ -438,7 +393,7 @@ class CreateCylinderInput(BaseModel):
         le=1000.0,
     )
     
-    location: Tuple[float, float, float] = Field(
+    location: Location = Field(
         default=(0.0, 0.0, 0.0),
         description="Location of the cylinder in 3D space (x, y, z)",
     )
@@ -449,34 +404,23 @@ class CreateCylinderInput(BaseModel):
         ge=3,
         le=256,
     )
+
+
+class CreateCylindersInput(InputModel):
+    """Input model for creating several cylinders in one call"""
     
-    @field_validator("location")
-    @classmethod
-    def validate_location(cls, v: Tuple[float, float, float]) -> Tuple[float, float, float]:
-        """Ensure location coordinates are within reasonable bounds"""
-        limit = 10000.0
-        x, y, z = v
-        if not all(-limit <= coord <= limit for coord in (x, y, z)):
-            raise ValueError(f"Location coordinates must be within ±{limit}")
-        return v
-    
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Ensure name doesn't contain invalid characters"""
-        invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-        if any(char in v for char in invalid_chars):
-            raise ValueError(f"Name cannot contain: {', '.join(invalid_chars)}")
-        return v.strip()
+    cylinders: Tuple[CreateCylinderInput, ...] = Field(
+        min_length=1,
+        max_length=1000,
+        description="One entry per cylinder, with the same fields as create_cylinder",
+    )
 
 
-class CreatePlaneInput(BaseModel):
+class CreatePlaneInput(InputModel):
     """Input model for creating a plane in Blender"""
     
-    name: str = Field(
+    name: NewName = Field(
         description="Name for the plane object (1-63 characters)",
-        min_length=1,
-        max_length=63,
     )
     
     size: float = Field(
@@ -486,112 +430,127 @@ class CreatePlaneInput(BaseModel):
         le=1000.0,
     )
     
-    location: Tuple[float, float, float] = Field(
+    location: Location = Field(
         default=(0.0, 0.0, 0.0),
         description="Location of the plane in 3D space (x, y, z)",
     )
-    
-    @field_validator("location")
-    @classmethod
-    def validate_location(cls, v: Tuple[float, float, float]) -> Tuple[float, float, float]:
-        """Ensure location coordinates are within reasonable bounds"""
-        limit = 10000.0
-        x, y, z = v
-        if not all(-limit <= coord <= limit for coord in (x, y, z)):
-            raise ValueError(f"Location coordinates must be within ±{limit}")
-        return v
-    
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Ensure name doesn't contain invalid characters"""
-        invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-        if any(char in v for char in invalid_chars):
-            raise ValueError(f"Name cannot contain: {', '.join(invalid_chars)}")
-        return v.strip()
 
 
-class DuplicateObjectInput(BaseModel):
+class DuplicateObjectInput(InputModel):
     """Input model for duplicating an object"""
     
-    name: str = Field(
+    name: DataName = Field(
         description="Name of the object to duplicate",
-        min_length=1,
-        max_length=63,
     )
     
-    new_name: str = Field(
+    new_name: NewName = Field(
         description="Name for the duplicated object (1-63 characters)",
-        min_length=1,
-        max_length=63,
     )
     
-    location: Optional[Tuple[float, float, float]] = Field(
+    location: Optional[Location] = Field(
         default=None,
         description="Optional location for the duplicate (if None, uses original location)",
     )
-    
-    @field_validator("location")
-    @classmethod
-    def validate_location(cls, v: Optional[Tuple[float, float, float]]) -> Optional[Tuple[float, float, float]]:
-        """Ensure location coordinates are within reasonable bounds"""
-        if v is None:
-            return None
-        limit = 10000.0
-        x, y, z = v
-        if not all(-limit <= coord <= limit for coord in (x, y, z)):
-            raise ValueError(f"Location coordinates must be within ±{limit}")
-        return v
-    
-    @field_validator("new_name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Ensure name doesn't contain invalid characters"""
-        invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-        if any(char in v for char in invalid_chars):
-            raise ValueError(f"Name cannot contain: {', '.join(invalid_chars)}")
-        return v.strip()
 
 
-class SetActiveCameraInput(BaseModel):
+class SetActiveCameraInput(InputModel):
     """Input model for setting the active camera"""
     
-    camera_name: str = Field(
+    camera_name: DataName = Field(
         description="Name of the camera to set as active",
-        min_length=1,
-        max_length=63,
     )
 
 
-class SaveFileInput(BaseModel):
+class SaveFileInput(InputModel):
     """Input model for saving the Blender file"""
     
-    filepath: str = Field(
+    filepath: BlendPath = Field(
         description="Full path where to save the .blend file (must end with .blend)",
-        min_length=1,
     )
-    
-    @field_validator("filepath")
-    @classmethod
-    def validate_filepath(cls, v: str) -> str:
-        """Ensure filepath ends with .blend"""
-        if not v.lower().endswith('.blend'):
-            raise ValueError("Filepath must end with .blend extension")
-        return v.strip()
 
 
-class OpenFileInput(BaseModel):
+class OpenFileInput(InputModel):
     """Input model for opening a Blender file"""
     
-    filepath: str = Field(
+    filepath: BlendPath = Field(
         description="Full path to the .blend file to open (must exist and end with .blend)",
+    )
+
+
+class BatchStep(InputModel):
+    """One step of a batch: an operation name and its arguments"""
+    
+    op: StrictStr = Field(
+        description="Operation to run - a tool name without the '_tool' suffix, e.g. 'create_cube'",
+    )
+    
+    args: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Arguments for the operation, as that tool takes them",
+    )
+
+
+class BatchInput(InputModel):
+    """Input model for running several operations in one call"""
+    
+    steps: Tuple[BatchStep, ...] = Field(
         min_length=1,
+        max_length=1000,
+        description="Operations to run, in order",
     )
+
+
+# Structured results, for the query tools' format="json" mode
+
+ResultFormat = Literal['text', 'json']
+
+
+class ObjectSummary(TypedDict):
+    """One object as listed by list_objects"""
     
-    @field_validator("filepath")
-    @classmethod
-    def validate_filepath(cls, v: str) -> str:
-        """Ensure filepath ends with .blend"""
-        if not v.lower().endswith('.blend'):
-            raise ValueError("Filepath must end with .blend extension")
-        return v.strip()
\ No newline at end of file
+    name: str
+    type: str
+    location: Tuple[float, float, float]
+
+
+class ObjectInfo(ObjectSummary):
+    """Full object details from get_object_info"""
+    
+    rotation: Tuple[float, float, float]
+    scale: Tuple[float, float, float]
+    vertices: NotRequired[int]  # mesh objects only
+    faces: NotRequired[int]  # mesh objects only
+
+
+ALL_MODELS = (
+    CreateCubeInput,
+    CreateSphereInput,
+    MoveObjectInput,
+    MoveObjectsInput,
+    DeleteObjectInput,
+    SelectObjectInput,
+    CreateMaterialInput,
+    AssignMaterialInput,
+    RotateObjectInput,
+    ScaleObjectInput,
+    TransformObjectInput,
+    GetObjectInfoInput,
+    CreateCameraInput,
+    CreateLightInput,
+    RenderSceneInput,
+    CreateCylinderInput,
+    CreateCylindersInput,
+    CreatePlaneInput,
+    DuplicateObjectInput,
+    SetActiveCameraInput,
+    SaveFileInput,
+    OpenFileInput,
+    BatchStep,
+    BatchInput,
+)
+
+
+def warm_up() -> None:
+    """Build every model's validator now, so no request pays for it"""
+    for model in ALL_MODELS:
+        model.model_rebuild()
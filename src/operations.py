@@ -5,42 +5,268 @@ work with the bpy API. These functions are pure business logic with no
 MCP dependencies, making them testable and reusable.
 """
 
-import bpy  # type: ignore
-from typing import List, Optional, TYPE_CHECKING
+import functools
+import math
+import os
+from typing import Any, Callable, Dict, List, Optional, ParamSpec, Tuple, TypeVar, Union
+
+# Import bpy - Blender's Python API - once, at load time. This only works
+# inside Blender (or with the bpy module installed); elsewhere every
+# operation returns an error string instead of touching bpy.
+try:
+    import bpy  # type: ignore
+except ImportError:
+    bpy: Any = None
+
 from .models import (
     CreateCubeInput,
     CreateSphereInput,
     MoveObjectInput,
+    MoveObjectsInput,
     DeleteObjectInput,
     SelectObjectInput,
     CreateMaterialInput,
     AssignMaterialInput,
     RotateObjectInput,
     ScaleObjectInput,
+    TransformObjectInput,
     GetObjectInfoInput,
     CreateCameraInput,
     CreateLightInput,
     RenderSceneInput,
     CreateCylinderInput,
+    CreateCylindersInput,
     CreatePlaneInput,
     DuplicateObjectInput,
     SetActiveCameraInput,
     SaveFileInput,
     OpenFileInput,
+    ObjectInfo,
+    ObjectSummary,
+)
+
+
+_BPY_MISSING = "Error: bpy module not found. Tool must run in Blender environment."
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+def _require_bpy(func: Callable[_P, _R]) -> Callable[_P, Union[_R, str]]:
+    """Make func return the bpy-not-found error when running outside Blender
+    
+    Decided once, when the module loads - inside Blender func is returned
+    unchanged, so there's no per-call check.
+    """
+    if bpy is not None:
+        return func
+    
+    @functools.wraps(func)
+    def unavailable(*args: _P.args, **kwargs: _P.kwargs) -> str:
+        return _BPY_MISSING
+    return unavailable
+
+
+# Operator submodule, resolved once - bpy.ops.<module> builds a new proxy on
+# every attribute access. bpy.data and bpy.context are deliberately not bound
+# here: Blender replaces bpy.data when a file is loaded.
+_mesh_ops: Any = bpy.ops.mesh if bpy is not None else None
+
+
+# Name -> object cache for the lookups every object operation starts with.
+# Each hit is re-checked (a removed object raises ReferenceError, a renamed
+# one no longer matches), and the cache is dropped whenever Blender replaces
+# its data wholesale (file load, undo/redo), which Python references don't survive.
+_OBJ_CACHE: Dict[str, Any] = {}
+
+
+def _resolve(name: str) -> Optional[Any]:
+    """Return the object called name (cached after the first lookup), or None"""
+    obj = _OBJ_CACHE.get(name)
+    if obj is not None:
+        try:
+            if obj.name == name:
+                return obj
+        except ReferenceError:
+            pass
+        _OBJ_CACHE.pop(name, None)
+    
+    obj = bpy.data.objects.get(name)
+    if obj is not None:
+        _OBJ_CACHE[name] = obj
+    return obj
+
+
+def _clear_object_cache(*_args: Any) -> None:
+    """Handler: forget every cached object reference"""
+    _OBJ_CACHE.clear()
+
+
+if bpy is not None:
+    _clear_object_cache = bpy.app.handlers.persistent(_clear_object_cache)
+    # Register once, replacing any copy left behind by a module reload
+    for _handlers in (
+        bpy.app.handlers.load_post,
+        bpy.app.handlers.undo_post,
+        bpy.app.handlers.redo_post,
+    ):
+        _handlers[:] = [
+            h for h in _handlers if getattr(h, "__name__", None) != _clear_object_cache.__name__
+        ]
+        _handlers.append(_clear_object_cache)
+
+
+def _select_only(obj: Any) -> None:
+    """Make obj the only selected object and the active one
+    
+    Deselects just the objects that are currently selected, instead of
+    running the select_all operator, which visits every object in the view
+    layer and goes through operator dispatch.
+    """
+    layer_objects = bpy.context.view_layer.objects
+    for other in list(layer_objects.selected):
+        other.select_set(False)
+    obj.select_set(True)
+    layer_objects.active = obj
+
+
+def _fmt_vec3(vec: Any) -> str:
+    """Format a 3-component Blender vector as "(x, y, z)" to 4 decimal places
+    
+    Reads the components directly rather than going through tuple() and
+    tuple.__repr__, and drops float32 noise like 0.30000001192092896.
+    """
+    return f"({vec.x:.4f}, {vec.y:.4f}, {vec.z:.4f})"
+
+
+def _add_object(name: str, data: Any, location: Any) -> Any:
+    """Create an object for data at location in the active collection
+    
+    Like the bpy.ops *_add operators, the new object ends up the only
+    selected object and the active one; unlike them, there's no operator
+    dispatch or undo push.
+    """
+    obj = bpy.data.objects.new(name, data)
+    obj.location = location
+    bpy.context.collection.objects.link(obj)
+    _select_only(obj)
+    # Blender may have suffixed the name (".001") if it was taken
+    _OBJ_CACHE[obj.name] = obj
+    return obj
+
+
+def _add_uv_map(mesh: Any, uvs: Tuple[float, ...]) -> None:
+    """Give mesh a "UVMap" layer from flattened per-loop (u, v) pairs
+    
+    The *_add operators generate one by default; meshes built with
+    from_pydata start without any, which leaves image textures unmapped.
+    """
+    mesh.uv_layers.new(name="UVMap").data.foreach_set("uv", uvs)
+
+
+# Unit cube template (edge length 1, centred on the origin), in the same
+# vertex order and face winding as Blender's own cube primitive
+_CUBE_VERTS = (
+    (-0.5, -0.5, -0.5), (-0.5, -0.5, 0.5), (-0.5, 0.5, -0.5), (-0.5, 0.5, 0.5),
+    (0.5, -0.5, -0.5), (0.5, -0.5, 0.5), (0.5, 0.5, -0.5), (0.5, 0.5, 0.5),
+)
+_CUBE_FACES = (
+    (0, 1, 3, 2), (2, 3, 7, 6), (6, 7, 5, 4),
+    (4, 5, 1, 0), (2, 6, 4, 0), (7, 3, 1, 5),
 )
+# Per-loop UVs in face order: the primitive's cross-shaped unwrap, one
+# quarter-width square per face
+_CUBE_UVS = tuple(
+    c
+    for x, y in ((0.375, 0.0), (0.375, 0.25), (0.375, 0.5), (0.375, 0.75), (0.125, 0.5), (0.625, 0.5))
+    for c in (x, y, x + 0.25, y, x + 0.25, y + 0.25, x, y + 0.25)
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _cube_verts(size: float) -> Tuple[Tuple[float, float, float], ...]:
+    """The cube template scaled to the given edge length, computed once per size"""
+    return tuple((x * size, y * size, z * size) for x, y, z in _CUBE_VERTS)
+
+
+# Unit plane template (edge length 1, on the XY plane, facing +Z)
+_PLANE_VERTS = ((-0.5, -0.5, 0.0), (0.5, -0.5, 0.0), (-0.5, 0.5, 0.0), (0.5, 0.5, 0.0))
+_PLANE_FACES = ((0, 1, 3, 2),)
+_PLANE_UVS = (0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0)
+
+
+@functools.lru_cache(maxsize=64)
+def _plane_verts(size: float) -> Tuple[Tuple[float, float, float], ...]:
+    """The plane template scaled to the given edge length, computed once per size"""
+    return tuple((x * size, y * size, z) for x, y, z in _PLANE_VERTS)
 
 
+@functools.lru_cache(maxsize=64)
+def _cylinder_geometry(
+    radius: float, depth: float, vertices: int
+) -> Tuple[tuple, tuple, tuple]:
+    """(verts, edges, faces) for a capped cylinder, centred on the origin
+    
+    Vertices come in the cylinder primitive's order: a (bottom, top) pair
+    per ring step, starting at +Y and going counter-clockwise seen from
+    above, so verts[2i] is on the bottom ring and verts[2i + 1] above it.
+    Sides are quads and the caps are n-gons, all wound so normals face
+    outwards.
+    """
+    n = vertices
+    half = depth / 2
+    verts = []
+    for i in range(n):
+        phi = 2 * math.pi * i / n
+        x, y = -radius * math.sin(phi), radius * math.cos(phi)
+        verts += [(x, y, -half), (x, y, half)]
+    sides = tuple(
+        (2 * i, 2 * ((i + 1) % n), 2 * ((i + 1) % n) + 1, 2 * i + 1) for i in range(n)
+    )
+    caps = (tuple(range(2 * n - 2, -1, -2)), tuple(range(1, 2 * n, 2)))
+    return tuple(verts), (), sides + caps
+
+
+@functools.lru_cache(maxsize=64)
+def _cylinder_uvs(vertices: int) -> Tuple[float, ...]:
+    """Flattened per-loop UVs matching _cylinder_geometry's faces
+    
+    Same layout as the cylinder primitive: the sides unwrapped into a strip
+    across the lower half, each cap a circle in the upper half placed from
+    its vertices' x/y positions (the bottom one mirrored, as seen from below).
+    """
+    n = vertices
+    verts, _, faces = _cylinder_geometry(1.0, 1.0, n)
+    sides = tuple(
+        c
+        for i in range(n)
+        for c in (i / n, 0.0, (i + 1) / n, 0.0, (i + 1) / n, 0.5, i / n, 0.5)
+    )
+    bottom = tuple(
+        c for v in faces[n] for c in (0.25 - 0.25 * verts[v][0], 0.75 + 0.25 * verts[v][1])
+    )
+    top = tuple(
+        c for v in faces[n + 1] for c in (0.75 + 0.25 * verts[v][0], 0.75 + 0.25 * verts[v][1])
+    )
+    return sides + bottom + top
+
+
+@_require_bpy
 def create_cube(input: CreateCubeInput) -> str:
     """
     Create a cube in the Blender scene.
     
     This function demonstrates:
-    - Using bpy.ops to create mesh primitives
-    - Accessing the active object after creation
-    - Setting object properties (name)
+    - Building mesh data directly with bpy.data.meshes.new() and from_pydata()
+    - Linking a new object into the active collection
+    - Setting object properties (name, location) directly
     - Proper error handling for Blender operations
     - Informative return messages
     
+    Creating the mesh from a fixed template skips the operator machinery
+    (context checks, undo push, redo panel) that bpy.ops.mesh.primitive_cube_add
+    goes through, which dominates the cost of adding a simple primitive.
+    
     Args:
         input: Validated input parameters containing:
             - name: Name for the cube object (1-63 characters)
@@ -56,31 +282,22 @@ def create_cube(input: CreateCubeInput) -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        # Import bpy - Blender's Python API
-        # This will only work when running inside Blender or with bpy module installed
-        import bpy  # type: ignore
+        mesh = bpy.data.meshes.new(input.name)
+        mesh.from_pydata(_cube_verts(input.size), [], _CUBE_FACES)
+        _add_uv_map(mesh, _CUBE_UVS)
         
-        bpy.ops.mesh.primitive_cube_add(
-            size=input.size,
-            location=input.location,
+        _add_object(input.name, mesh, input.location)
+        
+        return (
+            f"Successfully created cube '{input.name}' "
+            f"with size {input.size} at location {input.location}"
         )
         
-        cube = bpy.context.active_object
-        if cube:
-            cube.name = input.name
-            return (
-                f"Successfully created cube '{input.name}' "
-                f"with size {input.size} at location {input.location}"
-            )
-        else:
-            return "Error: Cube created but could not get reference to object"
-            
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Create Cube]: {str(e)}"
 
 
+@_require_bpy
 def create_sphere(input: CreateSphereInput) -> str:
     """
     Create a UV sphere in the Blender scene.
@@ -116,12 +333,8 @@ def create_sphere(input: CreateSphereInput) -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        # Import bpy - Blender's Python API
-        # This will only work when running inside Blender or with bpy module installed
-        import bpy  # type: ignore
-        
         # Build kwargs dict with all parameters
-        bpy.ops.mesh.primitive_uv_sphere_add(
+        _mesh_ops.primitive_uv_sphere_add(
             segments=input.segments,
             ring_count=input.ring_count,
             radius=input.radius,
@@ -145,12 +358,11 @@ def create_sphere(input: CreateSphereInput) -> str:
         else:
             return "Error: Sphere created but could not get reference to object"
             
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Create Sphere]: {str(e)}"
 
 
+@_require_bpy
 def move_object(input: MoveObjectInput) -> str:
     """
     Move an object to a new location in 3D space.
@@ -159,7 +371,6 @@ def move_object(input: MoveObjectInput) -> str:
     - Accessing objects from bpy.data.objects collection
     - Checking object existence before operations
     - Setting object location property directly
-    - Making objects active and selected for context
     - Proper error handling for missing objects
     
     Args:
@@ -176,16 +387,10 @@ def move_object(input: MoveObjectInput) -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        # Import bpy - Blender's Python API
-        # This will only work when running inside Blender or with bpy module installed
-        import bpy  # type: ignore
-        
-        obj = bpy.data.objects.get(input.name)
+        obj = _resolve(input.name)
         if obj is None:
             return f"Error: Object '{input.name}' not found"
         
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
         obj.location = input.location
         
         return (
@@ -193,18 +398,65 @@ def move_object(input: MoveObjectInput) -> str:
             f"to location {input.location}"
         )
         
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Move Object]: {str(e)}"
 
 
+@_require_bpy
+def move_objects(input: MoveObjectsInput) -> str:
+    """
+    Move several objects to new locations in one call.
+    
+    This function demonstrates:
+    - Resolving every object up front, before anything is changed
+    - Setting object location properties directly in a single pass
+    - Reporting all missing objects at once instead of failing on the first
+    
+    Each move is a plain location write, so Blender folds them into one
+    depsgraph evaluation on the next redraw - the saving over repeated
+    move_object calls is the per-call tool dispatch and validation.
+    
+    Args:
+        input: Validated input parameters containing:
+            - moves: Tuple of (name, (x, y, z)) pairs, one per object
+    
+    Returns:
+        Success message with the number of objects moved.
+        Format: "Successfully moved {count} object(s)"
+    
+    Raises:
+        Exception: If an object is not found or Blender operation fails.
+        Returns error message string instead of raising exception.
+        No object is moved if any name is missing.
+    """
+    try:
+        resolved = []
+        missing = []
+        for name, location in input.moves:
+            obj = _resolve(name)
+            if obj is None:
+                missing.append(name)
+            else:
+                resolved.append((obj, location))
+        if missing:
+            return f"Error: Object(s) not found: {', '.join(missing)}"
+        
+        for obj, location in resolved:
+            obj.location = location
+        
+        return f"Successfully moved {len(resolved)} object(s)"
+        
+    except Exception as e:
+        return f"Error [Move Objects]: {str(e)}"
+
+
+@_require_bpy
 def list_objects() -> str:
     """
     List all objects in the current Blender scene.
     
     This function demonstrates:
-    - Accessing bpy.data.objects collection
+    - Accessing the current scene's objects (bpy.context.scene.objects)
     - Iterating through all objects in the scene
     - Accessing object properties (name, type, location)
     - Formatting output for readability
@@ -223,30 +475,46 @@ def list_objects() -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        # Import bpy - Blender's Python API
-        # This will only work when running inside Blender or with bpy module installed
-        import bpy  # type: ignore
-        
-        objects = bpy.data.objects
+        # The scene's objects, not bpy.data.objects - that also holds
+        # objects from other scenes and ones not linked anywhere
+        objects = bpy.context.scene.objects
         if len(objects) == 0:
             return "Scene is empty - no objects found"
         
-        obj_list: List[str] = []
-        for obj in objects:
-            obj_info = (
-                f"  - {obj.name} ({obj.type}) "
-                f"at location {tuple(obj.location)}"
-            )
-            obj_list.append(obj_info)
+        obj_list: List[str] = [
+            f"  - {obj.name} ({obj.type}) at location {_fmt_vec3(obj.location)}"
+            for obj in objects
+        ]
+        
+        return f"Found {len(obj_list)} object(s):\n" + "\n".join(obj_list)
         
-        return f"Found {len(objects)} object(s):\n" + "\n".join(obj_list)
+    except Exception as e:
+        return f"Error [List Objects]: {str(e)}"
+
+
+@_require_bpy
+def list_objects_data() -> Union[List[ObjectSummary], str]:
+    """
+    List all objects in the current Blender scene as structured data.
+    
+    Same objects as list_objects, returned as one ObjectSummary dict per
+    object instead of formatted text, so clients don't have to parse it.
+    
+    Returns:
+        List of {"name", "type", "location"} dicts (empty for an empty scene),
+        or an error message string.
+    """
+    try:
+        return [
+            {"name": obj.name, "type": obj.type, "location": tuple(obj.location)}
+            for obj in bpy.context.scene.objects
+        ]
         
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [List Objects]: {str(e)}"
 
 
+@_require_bpy
 def delete_object(input: DeleteObjectInput) -> str:
     """
     Delete an object from the Blender scene.
@@ -271,31 +539,26 @@ def delete_object(input: DeleteObjectInput) -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        # Import bpy - Blender's Python API
-        # This will only work when running inside Blender or with bpy module installed
-        import bpy  # type: ignore
-        
-        obj = bpy.data.objects.get(input.name)
+        obj = _resolve(input.name)
         if obj is None:
             return f"Error: Object '{input.name}' not found"
         
+        _OBJ_CACHE.pop(input.name, None)
         bpy.data.objects.remove(obj)
         return f"Successfully deleted object '{input.name}'"
         
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Delete Object]: {str(e)}"
 
 
+@_require_bpy
 def select_object(input: SelectObjectInput) -> str:
     """
     Select an object by name, making it the active object.
     
     This function demonstrates:
     - Accessing objects from bpy.data.objects collection
-    - Deselecting all objects before selecting one
-    - Using bpy.ops.object.select_all() operator
+    - Deselecting the current selection before selecting one
     - Setting object selection state with select_set()
     - Making objects active for context-dependent operations
     - Proper error handling for missing objects
@@ -313,26 +576,19 @@ def select_object(input: SelectObjectInput) -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        # Import bpy - Blender's Python API
-        # This will only work when running inside Blender or with bpy module installed
-        import bpy  # type: ignore
-        
-        obj = bpy.data.objects.get(input.name)
+        obj = _resolve(input.name)
         if obj is None:
             return f"Error: Object '{input.name}' not found"
         
-        bpy.ops.object.select_all(action='DESELECT')
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
+        _select_only(obj)
         
         return f"Successfully selected object '{input.name}'"
         
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Select Object]: {str(e)}"
 
 
+@_require_bpy
 def create_material(input: CreateMaterialInput) -> str:
     """
     Create a new material with a base color.
@@ -362,10 +618,6 @@ def create_material(input: CreateMaterialInput) -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        # Import bpy - Blender's Python API
-        # This will only work when running inside Blender or with bpy module installed
-        import bpy  # type: ignore
-        
         # Check if material already exists
         if input.name in bpy.data.materials:
             return f"Error: Material '{input.name}' already exists"
@@ -384,25 +636,19 @@ def create_material(input: CreateMaterialInput) -> str:
             bsdf = mat.node_tree.nodes.get("Principled BSDF")
             if bsdf:
                 # Set the base color input (RGBA tuple: r, g, b, alpha)
-                # Color values are in range [0.0, 1.0]
-                bsdf.inputs["Base Color"].default_value = (
-                    input.color[0],  # Red
-                    input.color[1],  # Green
-                    input.color[2],  # Blue
-                    1.0              # Alpha (fully opaque)
-                )
+                # Color values are in range [0.0, 1.0]; alpha is fully opaque
+                bsdf.inputs["Base Color"].default_value = (*input.color, 1.0)
         
         return (
             f"Successfully created material '{input.name}' "
             f"with color RGB{input.color}"
         )
         
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Create Material]: {str(e)}"
 
 
+@_require_bpy
 def assign_material(input: AssignMaterialInput) -> str:
     """
     Assign a material to an object.
@@ -429,11 +675,7 @@ def assign_material(input: AssignMaterialInput) -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        # Import bpy - Blender's Python API
-        # This will only work when running inside Blender or with bpy module installed
-        import bpy  # type: ignore
-        
-        obj = bpy.data.objects.get(input.object_name)
+        obj = _resolve(input.object_name)
         if obj is None:
             return f"Error: Object '{input.object_name}' not found"
         
@@ -441,22 +683,23 @@ def assign_material(input: AssignMaterialInput) -> str:
         if mat is None:
             return f"Error: Material '{input.material_name}' not found"
         
-        if obj.data.materials:
-            obj.data.materials[0] = mat
+        # Resolve the RNA collection once rather than on every access
+        slots = obj.data.materials
+        if len(slots):
+            slots[0] = mat
         else:
-            obj.data.materials.append(mat)
+            slots.append(mat)
         
         return (
             f"Successfully assigned material '{input.material_name}' "
             f"to object '{input.object_name}'"
         )
         
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Assign Material]: {str(e)}"
 
 
+@_require_bpy
 def rotate_object(input: RotateObjectInput) -> str:
     """
     Rotate an object by setting its rotation angles.
@@ -481,11 +724,7 @@ def rotate_object(input: RotateObjectInput) -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        # Import bpy - Blender's Python API
-        # This will only work when running inside Blender or with bpy module installed
-        import bpy  # type: ignore
-        
-        obj = bpy.data.objects.get(input.name)
+        obj = _resolve(input.name)
         if obj is None:
             return f"Error: Object '{input.name}' not found"
         
@@ -496,12 +735,11 @@ def rotate_object(input: RotateObjectInput) -> str:
             f"to rotation {input.rotation}"
         )
         
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Rotate Object]: {str(e)}"
 
 
+@_require_bpy
 def scale_object(input: ScaleObjectInput) -> str:
     """
     Scale an object by setting its scale factors.
@@ -526,11 +764,7 @@ def scale_object(input: ScaleObjectInput) -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        # Import bpy - Blender's Python API
-        # This will only work when running inside Blender or with bpy module installed
-        import bpy  # type: ignore
-        
-        obj = bpy.data.objects.get(input.name)
+        obj = _resolve(input.name)
         if obj is None:
             return f"Error: Object '{input.name}' not found"
         
@@ -541,12 +775,70 @@ def scale_object(input: ScaleObjectInput) -> str:
             f"to scale {input.scale}"
         )
         
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Scale Object]: {str(e)}"
 
 
+@_require_bpy
+def transform_object(input: TransformObjectInput) -> str:
+    """
+    Set an object's location, rotation and scale in one call.
+    
+    This function demonstrates:
+    - Accessing objects from bpy.data.objects collection
+    - Checking object existence before operations
+    - Setting only the transform properties that were given
+    - Proper error handling for missing objects
+    
+    Args:
+        input: Validated input parameters containing:
+            - name: Name of the object to transform (must exist in scene)
+            - location: Optional tuple of (x, y, z) coordinates
+            - rotation: Optional tuple of (x, y, z) rotation values in radians
+            - scale: Optional tuple of (x, y, z) scale factors
+    
+    Returns:
+        Success message listing the properties that were set.
+        Format: "Successfully transformed object '{name}': location {location}, ..."
+    
+    Raises:
+        Exception: If object is not found or Blender operation fails.
+        Returns error message string instead of raising exception.
+    """
+    try:
+        changes = [
+            (prop, value)
+            for prop, value in (
+                ("location", input.location),
+                ("rotation", input.rotation),
+                ("scale", input.scale),
+            )
+            if value is not None
+        ]
+        if not changes:
+            return f"Error: No location, rotation or scale given for '{input.name}'"
+        
+        obj = _resolve(input.name)
+        if obj is None:
+            return f"Error: Object '{input.name}' not found"
+        
+        if input.location is not None:
+            obj.location = input.location
+        if input.rotation is not None:
+            obj.rotation_euler = input.rotation
+        if input.scale is not None:
+            obj.scale = input.scale
+        
+        return (
+            f"Successfully transformed object '{input.name}': "
+            + ", ".join(f"{prop} {value}" for prop, value in changes)
+        )
+        
+    except Exception as e:
+        return f"Error [Transform Object]: {str(e)}"
+
+
+@_require_bpy
 def get_object_info(input: GetObjectInfoInput) -> str:
     """
     Get detailed information about an object in the scene.
@@ -574,45 +866,85 @@ def get_object_info(input: GetObjectInfoInput) -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        # Import bpy - Blender's Python API
-        # This will only work when running inside Blender or with bpy module installed
-        import bpy  # type: ignore
-        
-        obj = bpy.data.objects.get(input.name)
+        obj = _resolve(input.name)
         if obj is None:
             return f"Error: Object '{input.name}' not found"
         
         info_lines: List[str] = [
             f"Object: {obj.name}",
             f"Type: {obj.type}",
-            f"Location: {tuple(obj.location)}",
-            f"Rotation: {tuple(obj.rotation_euler)}",
-            f"Scale: {tuple(obj.scale)}",
+            f"Location: {_fmt_vec3(obj.location)}",
+            f"Rotation: {_fmt_vec3(obj.rotation_euler)}",
+            f"Scale: {_fmt_vec3(obj.scale)}",
         ]
         
-        if obj.type == 'MESH' and obj.data:
-            info_lines.append(f"Vertices: {len(obj.data.vertices)}")
-            info_lines.append(f"Faces: {len(obj.data.polygons)}")
+        mesh = obj.data if obj.type == 'MESH' else None
+        if mesh:
+            info_lines.extend((
+                f"Vertices: {len(mesh.vertices)}",
+                f"Faces: {len(mesh.polygons)}",
+            ))
         
         return "\n".join(info_lines)
         
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Get Object Info]: {str(e)}"
 
 
+@_require_bpy
+def get_object_info_data(input: GetObjectInfoInput) -> Union[ObjectInfo, str]:
+    """
+    Get detailed information about an object as structured data.
+    
+    Same details as get_object_info, returned as an ObjectInfo dict instead
+    of formatted text; vertices/faces are only present for mesh objects.
+    
+    Args:
+        input: Validated input parameters containing:
+            - name: Name of the object to get information about (must exist in scene)
+    
+    Returns:
+        ObjectInfo dict, or an error message string.
+    """
+    try:
+        obj = _resolve(input.name)
+        if obj is None:
+            return f"Error: Object '{input.name}' not found"
+        
+        info: ObjectInfo = {
+            "name": obj.name,
+            "type": obj.type,
+            "location": tuple(obj.location),
+            "rotation": tuple(obj.rotation_euler),
+            "scale": tuple(obj.scale),
+        }
+        
+        mesh = obj.data if obj.type == 'MESH' else None
+        if mesh:
+            info["vertices"] = len(mesh.vertices)
+            info["faces"] = len(mesh.polygons)
+        
+        return info
+        
+    except Exception as e:
+        return f"Error [Get Object Info]: {str(e)}"
+
+
+@_require_bpy
 def create_camera(input: CreateCameraInput) -> str:
     """
     Create a camera in the Blender scene.
     
     This function demonstrates:
-    - Using bpy.ops to create camera objects
+    - Creating camera data and its object directly (bpy.data.cameras.new)
     - Setting camera location and rotation
-    - Accessing the active object after creation
-    - Setting object properties (name)
+    - Linking the object into the active collection
     - Proper error handling for Blender operations
     
+    Building the datablocks directly skips the operator machinery (context
+    checks, undo push, redo panel) that bpy.ops.object.camera_add goes
+    through; a camera has no geometry, so that machinery is all it costs.
+    
     Args:
         input: Validated input parameters containing:
             - name: Name for the camera object (1-63 characters)
@@ -628,41 +960,27 @@ def create_camera(input: CreateCameraInput) -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        # Import bpy - Blender's Python API
-        # This will only work when running inside Blender or with bpy module installed
-        import bpy  # type: ignore
-        
-        bpy.ops.object.camera_add(
-            location=input.location,
-            rotation=input.rotation,
-        )
-        
-        camera = bpy.context.active_object
-        if camera is None:
-            return "Error: Camera created but could not get reference to object"
-        
-        camera.name = input.name
+        camera = _add_object(input.name, bpy.data.cameras.new(input.name), input.location)
+        camera.rotation_euler = input.rotation
         
         return (
             f"Successfully created camera '{input.name}' "
             f"at location {input.location} with rotation {input.rotation}"
         )
         
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Create Camera]: {str(e)}"
 
 
+@_require_bpy
 def create_light(input: CreateLightInput) -> str:
     """
     Create a light in the Blender scene.
     
     This function demonstrates:
-    - Using bpy.ops to create different types of lights
+    - Creating light data of a given type and its object directly
     - Setting light location and energy
-    - Accessing light data properties
-    - Setting object properties (name)
+    - Linking the object into the active collection
     - Proper error handling for Blender operations
     
     Args:
@@ -681,41 +999,22 @@ def create_light(input: CreateLightInput) -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        # Import bpy - Blender's Python API
-        # This will only work when running inside Blender or with bpy module installed
-        import bpy  # type: ignore
-        
-        # Create light based on type
-        if input.light_type == "SUN":
-            bpy.ops.object.light_add(type='SUN', location=input.location)
-        elif input.light_type == "POINT":
-            bpy.ops.object.light_add(type='POINT', location=input.location)
-        elif input.light_type == "SPOT":
-            bpy.ops.object.light_add(type='SPOT', location=input.location)
-        elif input.light_type == "AREA":
-            bpy.ops.object.light_add(type='AREA', location=input.location)
-        
-        light = bpy.context.active_object
-        if light is None:
-            return "Error: Light created but could not get reference to object"
-        
-        light.name = input.name
-        
-        # Set light energy
-        if light.data:
-            light.data.energy = input.energy
+        # light_type is already validated as one of Blender's light enum values
+        light_data = bpy.data.lights.new(input.name, type=input.light_type)
+        light_data.energy = input.energy
+        
+        _add_object(input.name, light_data, input.location)
         
         return (
             f"Successfully created {input.light_type} light '{input.name}' "
             f"at location {input.location} with energy {input.energy}"
         )
         
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Create Light]: {str(e)}"
 
 
+@_require_bpy
 def render_scene(input: RenderSceneInput) -> str:
     """
     Render the current scene to an image file.
@@ -743,20 +1042,19 @@ def render_scene(input: RenderSceneInput) -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        # Import bpy - Blender's Python API
-        # This will only work when running inside Blender or with bpy module installed
-        import bpy  # type: ignore
+        scene = bpy.context.scene
         
         # Check for active camera before rendering (Blender Rule #3)
-        if bpy.context.scene.camera is None:
+        if scene.camera is None:
             return "Error [Render Scene]: No active camera found. Create a camera before rendering."
         
         # Set render resolution
-        bpy.context.scene.render.resolution_x = input.resolution_x
-        bpy.context.scene.render.resolution_y = input.resolution_y
+        render = scene.render
+        render.resolution_x = input.resolution_x
+        render.resolution_y = input.resolution_y
         
         # Set output filepath
-        bpy.context.scene.render.filepath = input.filepath
+        render.filepath = input.filepath
         
         # Render the scene
         bpy.ops.render.render(write_still=True)
@@ -766,12 +1064,11 @@ def render_scene(input: RenderSceneInput) -> str:
             f"at resolution {input.resolution_x}x{input.resolution_y}"
         )
         
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Render Scene]: {str(e)}"
 
 
+@_require_bpy
 def save_file(input: SaveFileInput) -> str:
     """
     Save the current Blender scene to a .blend file.
@@ -795,9 +1092,6 @@ def save_file(input: SaveFileInput) -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        import bpy  # type: ignore
-        import os
-        
         # Ensure directory exists
         directory = os.path.dirname(input.filepath)
         if directory and not os.path.exists(directory):
@@ -808,12 +1102,11 @@ def save_file(input: SaveFileInput) -> str:
         
         return f"Successfully saved Blender file to '{input.filepath}'"
         
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Save File]: {str(e)}"
 
 
+@_require_bpy
 def open_file(input: OpenFileInput) -> str:
     """
     Open a .blend file in Blender.
@@ -836,9 +1129,6 @@ def open_file(input: OpenFileInput) -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        import bpy  # type: ignore
-        import os
-        
         # Check if file exists
         if not os.path.exists(input.filepath):
             return f"Error [Open File]: File not found: '{input.filepath}'"
@@ -848,12 +1138,11 @@ def open_file(input: OpenFileInput) -> str:
         
         return f"Successfully opened Blender file '{input.filepath}'"
         
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Open File]: {str(e)}"
 
 
+@_require_bpy
 def get_scene_filepath() -> str:
     """
     Get the filepath of the current Blender file.
@@ -876,35 +1165,43 @@ def get_scene_filepath() -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        import bpy  # type: ignore
-        
         filepath = bpy.data.filepath
         if filepath:
             return f"Current Blender file: {filepath}"
         else:
             return "File not saved yet (unsaved file)"
             
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Get Scene Filepath]: {str(e)}"
 
 
+@_require_bpy
 def clear_scene() -> str:
     """
     Clear all objects from the current Blender scene.
     
     This function demonstrates:
-    - Selecting all objects in the scene
-    - Deleting all selected objects
+    - Collecting the current scene's objects (bpy.context.scene.objects)
+    - Removing them in one call with bpy.data.batch_remove()
+    - Unlinking objects shared with other scenes instead of deleting them
     - Proper error handling for scene operations
     
+    batch_remove deletes every object in a single pass through the data API,
+    instead of select_all + delete, which go through operator dispatch, undo
+    push and a redraw, and only reach objects that are visible and selectable.
+    Objects that other scenes also use are only unlinked, and only from
+    collections no other scene uses, so those scenes keep them. An object
+    held by a collection that another scene also links is left in place.
+    
     Args:
         None: This function takes no parameters and clears all objects.
     
     Returns:
         Success message with count of deleted objects.
-        Format: "Successfully cleared scene - removed {count} object(s)"
+        Format: "Successfully cleared scene - removed {count} object(s)",
+        followed by ", unlinked {count} object(s) also used by other scenes"
+        and ", left {count} object(s) in collections shared with other
+        scenes" when those apply.
         Returns "Scene was already empty" if no objects existed.
     
     Raises:
@@ -912,30 +1209,46 @@ def clear_scene() -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        # Import bpy - Blender's Python API
-        # This will only work when running inside Blender or with bpy module installed
-        import bpy  # type: ignore
+        scene = bpy.context.scene
+        objects = list(scene.objects)
         
-        objects = bpy.data.objects
-        count: int = len(objects)
-        
-        if count == 0:
+        if not objects:
             return "Scene was already empty"
         
-        # Select all objects
-        bpy.ops.object.select_all(action='SELECT')
-        
-        # Delete all selected objects
-        bpy.ops.object.delete()
+        owned = [obj for obj in objects if len(obj.users_scene) <= 1]
+        shared = [obj for obj in objects if len(obj.users_scene) > 1]
+        
+        _OBJ_CACHE.clear()
+        if shared:
+            # Unlinking from a collection another scene also links would take
+            # the object out of that scene too; a scene's master collection
+            # is never shared
+            elsewhere = set()
+            for other in bpy.data.scenes:
+                if other != scene:
+                    elsewhere.update(other.collection.children_recursive)
+            for collection in (scene.collection, *scene.collection.children_recursive):
+                if collection in elsewhere:
+                    continue
+                linked = collection.objects
+                for obj in shared:
+                    if obj.name in linked:
+                        linked.unlink(obj)
+        bpy.data.batch_remove(owned)
+        
+        left = sum(1 for obj in shared if scene in obj.users_scene)
+        message = f"Successfully cleared scene - removed {len(owned)} object(s)"
+        if len(shared) > left:
+            message += f", unlinked {len(shared) - left} object(s) also used by other scenes"
+        if left:
+            message += f", left {left} object(s) in collections shared with other scenes"
+        return message
         
-        return f"Successfully cleared scene - removed {count} object(s)"
-        
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Clear Scene]: {str(e)}"
 
 
+@_require_bpy
 def duplicate_object(input: DuplicateObjectInput) -> str:
     """
     Duplicate an object in the Blender scene.
@@ -943,10 +1256,15 @@ def duplicate_object(input: DuplicateObjectInput) -> str:
     This function demonstrates:
     - Accessing objects from bpy.data.objects collection
     - Checking object existence before duplication
-    - Using bpy.ops.object.duplicate() to clone objects
+    - Copying the object and its data directly (obj.copy(), data.copy())
+    - Linking the copy into the same collections as the original
     - Setting location and name of duplicate
     - Proper error handling for missing objects
     
+    Copying through the data API skips the operator machinery (context
+    checks, undo push, redo panel) of bpy.ops.object.duplicate, and the
+    select/active juggling needed to aim the operator at the right object.
+    
     Args:
         input: Validated input parameters containing:
             - name: Name of the object to duplicate (must exist in scene)
@@ -962,40 +1280,35 @@ def duplicate_object(input: DuplicateObjectInput) -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        # Import bpy - Blender's Python API
-        # This will only work when running inside Blender or with bpy module installed
-        import bpy  # type: ignore
-        
-        obj = bpy.data.objects.get(input.name)
+        obj = _resolve(input.name)
         if obj is None:
             return f"Error: Object '{input.name}' not found"
         
-        # Select and make active
-        bpy.ops.object.select_all(action='DESELECT')
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
-        
-        # Duplicate the object
-        bpy.ops.object.duplicate()
-        
-        # Get the duplicated object
-        duplicate = bpy.context.active_object
-        if duplicate is None:
-            return "Error: Object duplicated but could not get reference"
+        # Like the operator's default, the copy gets its own object data
+        # (a separate mesh) rather than sharing the original's
+        duplicate = obj.copy()
+        if obj.data is not None:
+            duplicate.data = obj.data.copy()
         
         # Set name and location
         duplicate.name = input.new_name
         if input.location is not None:
             duplicate.location = input.location
         
+        for collection in obj.users_collection:
+            collection.objects.link(duplicate)
+        _OBJ_CACHE[duplicate.name] = duplicate
+        
+        # Match the operator: the duplicate ends up the only selected object
+        _select_only(duplicate)
+        
         return f"Successfully duplicated object '{input.name}' as '{input.new_name}'"
         
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Duplicate Object]: {str(e)}"
 
 
+@_require_bpy
 def set_active_camera(input: SetActiveCameraInput) -> str:
     """
     Set the active camera for rendering.
@@ -1019,11 +1332,7 @@ def set_active_camera(input: SetActiveCameraInput) -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        # Import bpy - Blender's Python API
-        # This will only work when running inside Blender or with bpy module installed
-        import bpy  # type: ignore
-        
-        camera_obj = bpy.data.objects.get(input.camera_name)
+        camera_obj = _resolve(input.camera_name)
         if camera_obj is None:
             return f"Error: Camera '{input.camera_name}' not found"
         
@@ -1035,23 +1344,25 @@ def set_active_camera(input: SetActiveCameraInput) -> str:
         
         return f"Successfully set '{input.camera_name}' as active camera"
         
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Set Active Camera]: {str(e)}"
 
 
+@_require_bpy
 def create_cylinder(input: CreateCylinderInput) -> str:
     """
     Create a cylinder in the Blender scene.
     
     This function demonstrates:
-    - Using bpy.ops to create cylinder mesh primitives
+    - Building mesh data directly (bpy.data.meshes.new, from_pydata)
     - Setting cylinder properties (radius, depth, vertices)
-    - Accessing the active object after creation
-    - Setting object properties (name)
+    - Linking the object into the active collection
     - Proper error handling for Blender operations
     
+    Like create_cube, this skips the operator machinery of
+    bpy.ops.mesh.primitive_cylinder_add; the ring geometry is computed once
+    per (radius, depth, vertices).
+    
     Args:
         input: Validated input parameters containing:
             - name: Name for the cylinder object (1-63 characters)
@@ -1069,43 +1380,76 @@ def create_cylinder(input: CreateCylinderInput) -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        # Import bpy - Blender's Python API
-        # This will only work when running inside Blender or with bpy module installed
-        import bpy  # type: ignore
-        
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=input.radius,
-            depth=input.depth,
-            location=input.location,
-            vertices=input.vertices,
+        mesh = bpy.data.meshes.new(input.name)
+        mesh.from_pydata(
+            *_cylinder_geometry(input.radius, input.depth, input.vertices)
         )
-        
-        cylinder = bpy.context.active_object
-        if cylinder is None:
-            return "Error: Cylinder created but could not get reference to object"
-        
-        cylinder.name = input.name
+        _add_uv_map(mesh, _cylinder_uvs(input.vertices))
+        _add_object(input.name, mesh, input.location)
         
         return (
             f"Successfully created cylinder '{input.name}' "
             f"with radius {input.radius} and depth {input.depth} at location {input.location}"
         )
         
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Create Cylinder]: {str(e)}"
 
 
+@_require_bpy
+def create_cylinders(input: CreateCylindersInput) -> str:
+    """
+    Create several cylinders in the Blender scene in one call.
+    
+    This function demonstrates:
+    - Building each mesh directly (bpy.data.meshes.new, from_pydata)
+    - Reusing cached ring geometry for cylinders with the same dimensions
+    - Reporting how far a batch got when one entry fails
+    
+    Every cylinder is created exactly as create_cylinder would; the saving
+    is one tool round trip and validation pass for the whole batch.
+    
+    Args:
+        input: Validated input parameters containing:
+            - cylinders: Tuple of CreateCylinderInput, one per cylinder
+    
+    Returns:
+        Success message with the number of cylinders created.
+        Format: "Successfully created {count} cylinder(s)"
+    
+    Raises:
+        Exception: If Blender operation fails or bpy module is not available.
+        Returns error message string instead of raising exception.
+    """
+    created = 0
+    try:
+        for cylinder in input.cylinders:
+            mesh = bpy.data.meshes.new(cylinder.name)
+            mesh.from_pydata(
+                *_cylinder_geometry(cylinder.radius, cylinder.depth, cylinder.vertices)
+            )
+            _add_uv_map(mesh, _cylinder_uvs(cylinder.vertices))
+            _add_object(cylinder.name, mesh, cylinder.location)
+            created += 1
+        
+        return f"Successfully created {created} cylinder(s)"
+        
+    except Exception as e:
+        return (
+            f"Error [Create Cylinders]: {str(e)} "
+            f"(created {created} of {len(input.cylinders)})"
+        )
+
+
+@_require_bpy
 def create_plane(input: CreatePlaneInput) -> str:
     """
     Create a plane in the Blender scene.
     
     This function demonstrates:
-    - Using bpy.ops to create plane mesh primitives
+    - Building mesh data directly (bpy.data.meshes.new, from_pydata)
     - Setting plane size
-    - Accessing the active object after creation
-    - Setting object properties (name)
+    - Linking the object into the active collection
     - Proper error handling for Blender operations
     
     Args:
@@ -1123,27 +1467,15 @@ def create_plane(input: CreatePlaneInput) -> str:
         Returns error message string instead of raising exception.
     """
     try:
-        # Import bpy - Blender's Python API
-        # This will only work when running inside Blender or with bpy module installed
-        import bpy  # type: ignore
-        
-        bpy.ops.mesh.primitive_plane_add(
-            size=input.size,
-            location=input.location,
-        )
-        
-        plane = bpy.context.active_object
-        if plane is None:
-            return "Error: Plane created but could not get reference to object"
-        
-        plane.name = input.name
+        mesh = bpy.data.meshes.new(input.name)
+        mesh.from_pydata(_plane_verts(input.size), [], _PLANE_FACES)
+        _add_uv_map(mesh, _PLANE_UVS)
+        _add_object(input.name, mesh, input.location)
         
         return (
             f"Successfully created plane '{input.name}' "
             f"with size {input.size} at location {input.location}"
         )
         
-    except ImportError:
-        return "Error: bpy module not found. Tool must run in Blender environment."
     except Exception as e:
         return f"Error [Create Plane]: {str(e)}"
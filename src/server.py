@@ -1,16 +1,130 @@
 """MCP Server - imports tools and runs server"""
 
+import asyncio
+import os
 import sys
+import threading
+from typing import Optional
+
+try:
+    import uvloop  # type: ignore
+except ImportError:
+    uvloop = None
+
+from .models import warm_up
 from .tools import mcp  # Import mcp instance (tools register themselves)
 
-def run() -> None:
+def run(stop_event: Optional[threading.Event] = None) -> None:
     """
     Run the MCP server.
     
     Note: This function expects stdout/stderr redirection to be set up
     by the caller (blender_mcp_server.py) before importing this module.
     FastMCP will restore stdout for JSON-RPC communication.
+    
+    Args:
+        stop_event: Optional event that shuts the server down when set
+            (used by the Blender addon, which runs the server in a thread)
     """
     # FastMCP handles its own logging and JSON-RPC via stdout
-    mcp.run()
+    # uvloop, when installed, is a faster drop-in for the default event loop
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    asyncio.run(_serve(stop_event), loop_factory=loop_factory)
+
+
+async def _serve(stop_event: Optional[threading.Event]) -> None:
+    """Serve on this event loop, building model validators once it's running"""
+    # Runs on the loop right after startup - while the client is still
+    # connecting - instead of during import or inside the first tool call
+    asyncio.get_running_loop().call_soon(warm_up)
+    if stop_event is None:
+        await mcp.run_async()
+    else:
+        await _run_until_stopped(stop_event)
+
+
+async def _run_until_stopped(stop_event: threading.Event) -> None:
+    """Serve until the client disconnects or stop_event is set"""
+    # Cancelling run_async() doesn't stop it: the stdio transport reads stdin
+    # in a worker thread that nothing can interrupt. So the server reads from
+    # a pipe fed from the real stdin instead, and stopping closes the pipe -
+    # the transport sees end of input and shuts down normally.
+    # The transport also closes the sys.stdin/sys.stdout it wraps once it's
+    # done, so it gets private ones: the pipe, and a duplicate of stdout.
+    saved_stdin, saved_stdout = sys.stdin, sys.stdout
+    sys.stdin = open(_attach_stdin_pipe(), "r", encoding="utf-8")
+    sys.stdout = open(os.dup(saved_stdout.fileno()), "w", encoding="utf-8", buffering=1)
+    try:
+        server = asyncio.create_task(mcp.run_async())
+        try:
+            while not server.done():
+                # Event.wait returns as soon as the event is set, so stopping
+                # doesn't wait out a sleep; the timeout only bounds how long
+                # a finished server goes unnoticed
+                if await asyncio.to_thread(stop_event.wait, 0.5):
+                    break
+        finally:
+            _detach_stdin_pipe()
+        await server
+    finally:
+        sys.stdin, sys.stdout = saved_stdin, saved_stdout
+
+
+# One thread owns the real stdin for the life of the process and copies it
+# into the running server's pipe. It reads with os.read rather than
+# sys.stdin: a daemon thread blocked inside the buffered reader holds its
+# lock, which crashes interpreter shutdown.
+_stdin_lock = threading.Lock()
+_stdin_started = False
+_stdin_pipe: Optional[int] = None  # write end of the running server's pipe
+_stdin_eof = False
+
+
+def _attach_stdin_pipe() -> int:
+    """Create a pipe fed from the real stdin, returning its read end"""
+    global _stdin_started, _stdin_pipe
+    read_end, write_end = os.pipe()
+    with _stdin_lock:
+        if not _stdin_started:
+            threading.Thread(
+                target=_pump_stdin, args=(os.dup(0),), name="mcp-stdin", daemon=True
+            ).start()
+            _stdin_started = True
+        if _stdin_eof:
+            os.close(write_end)  # client already gone - the server sees EOF at once
+        else:
+            _stdin_pipe = write_end
+    return read_end
+
+
+def _detach_stdin_pipe() -> None:
+    """Close the running server's pipe, ending its input"""
+    global _stdin_pipe
+    with _stdin_lock:
+        if _stdin_pipe is not None:
+            os.close(_stdin_pipe)
+            _stdin_pipe = None
+
 
+def _pump_stdin(fd: int) -> None:
+    """Stdin thread: copy input into the attached pipe (dropped when none is) until EOF"""
+    global _stdin_pipe, _stdin_eof
+    while True:
+        try:
+            chunk = os.read(fd, 65536)
+        except OSError:
+            chunk = b""
+        with _stdin_lock:
+            if not chunk:
+                _stdin_eof = True
+                if _stdin_pipe is not None:
+                    os.close(_stdin_pipe)
+                    _stdin_pipe = None
+                return
+            if _stdin_pipe is not None:
+                try:
+                    view = memoryview(chunk)
+                    while view:
+                        view = view[os.write(_stdin_pipe, view):]
+                except OSError:
+                    pass  # server already gone
@@ -1,40 +1,56 @@
 """MCP tools - thin wrappers around operations"""
 
-from typing import Tuple, Optional
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Any, Awaitable, Callable, Dict, List, ParamSpec, Tuple, TypeVar, Optional, Union
 from fastmcp import FastMCP
+from pydantic import Field
 from .models import (
     CreateCubeInput,
     CreateSphereInput,
     MoveObjectInput,
+    MoveObjectsInput,
     DeleteObjectInput,
     SelectObjectInput,
     CreateMaterialInput,
     AssignMaterialInput,
     RotateObjectInput,
     ScaleObjectInput,
+    TransformObjectInput,
     GetObjectInfoInput,
     CreateCameraInput,
     CreateLightInput,
+    LightType,
     RenderSceneInput,
     CreateCylinderInput,
+    CreateCylindersInput,
     CreatePlaneInput,
     DuplicateObjectInput,
     SetActiveCameraInput,
     SaveFileInput,
     OpenFileInput,
+    BatchInput,
+    ObjectInfo,
+    ObjectSummary,
+    ResultFormat,
 )
 from .operations import (
     create_cube,
     create_sphere,
     move_object,
+    move_objects,
     list_objects,
+    list_objects_data,
     delete_object,
     select_object,
     create_material,
     assign_material,
     rotate_object,
     scale_object,
+    transform_object,
     get_object_info,
+    get_object_info_data,
     create_camera,
     create_light,
     render_scene,
@@ -42,6 +58,7 @@ from .operations import (
     duplicate_object,
     set_active_camera,
     create_cylinder,
+    create_cylinders,
     create_plane,
     get_scene_filepath,
     save_file,
@@ -49,10 +66,39 @@ from .operations import (
 )
 
 # Create MCP instance - tools will register themselves via decorator
+# Each tool's docstring becomes its description for the client, so don't
+# run the server under python -OO / PYTHONOPTIMIZE=2 (it strips docstrings)
 mcp = FastMCP("blender_server")
 
+# Operations run on this one worker thread rather than on the event loop:
+# a slow call (a render, opening a file) no longer stalls the loop, and a
+# single worker keeps bpy calls one at a time and in arrival order, since
+# bpy isn't thread-safe
+_BPY_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="blender-ops")
+
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+async def _run(operation: Callable[..., _R], *args: Any) -> _R:
+    """Run an operation on the bpy worker thread and wait for its result"""
+    return await asyncio.get_running_loop().run_in_executor(_BPY_EXECUTOR, operation, *args)
+
+
+def _tool_errors(tool: Callable[_P, Awaitable[_R]]) -> Callable[_P, Awaitable[Union[_R, str]]]:
+    """Return any exception the tool raises (usually a validation error) as an error string"""
+    @functools.wraps(tool)
+    async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> Union[_R, str]:
+        try:
+            return await tool(*args, **kwargs)
+        except Exception as e:
+            return f"Error: {str(e)}"
+    return wrapper
+
 
 @mcp.tool()
+@_tool_errors
 async def create_cube_tool(
     name: str,
     size: float = 2.0,
@@ -75,14 +121,12 @@ async def create_cube_tool(
     Example:
         Create a cube named "Table" with size 2.0 at position (0, 0, 1)
     """
-    try:
-        input_model = CreateCubeInput(name=name, size=size, location=location)
-        return create_cube(input_model)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    input_model = CreateCubeInput(name=name, size=size, location=location)
+    return await _run(create_cube, input_model)
 
 
 @mcp.tool()
+@_tool_errors
 async def create_sphere_tool(
     name: str,
     segments: int = 32,
@@ -119,25 +163,23 @@ async def create_sphere_tool(
     Example:
         Create a sphere named "Ball" with radius 0.5, 32 segments, 16 rings at position (1, 2, 3)
     """
-    try:
-        input_model = CreateSphereInput(
-            name=name,
-            segments=segments,
-            ring_count=ring_count,
-            radius=radius,
-            calc_uvs=calc_uvs,
-            enter_editmode=enter_editmode,
-            align=align,  # type: ignore
-            location=location,
-            rotation=rotation,
-            scale=scale
-        )
-        return create_sphere(input_model)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    input_model = CreateSphereInput(
+        name=name,
+        segments=segments,
+        ring_count=ring_count,
+        radius=radius,
+        calc_uvs=calc_uvs,
+        enter_editmode=enter_editmode,
+        align=align,  # type: ignore
+        location=location,
+        rotation=rotation,
+        scale=scale
+    )
+    return await _run(create_sphere, input_model)
 
 
 @mcp.tool()
+@_tool_errors
 async def move_object_tool(
     name: str,
     location: Tuple[float, float, float]
@@ -159,34 +201,64 @@ async def move_object_tool(
     Example:
         Move object "Cube" to position (5, 0, 2)
     """
-    try:
-        input_model = MoveObjectInput(name=name, location=location)
-        return move_object(input_model)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    input_model = MoveObjectInput(name=name, location=location)
+    return await _run(move_object, input_model)
 
 
 @mcp.tool()
-async def list_objects_tool() -> str:
+@_tool_errors
+async def move_objects_tool(
+    moves: Tuple[Tuple[str, Tuple[float, float, float]], ...]
+) -> str:
+    """
+    Move several objects to new locations in a single call.
+    
+    Use this instead of repeated move_object_tool calls when laying out
+    many objects at once. Nothing is moved if any of the names is missing.
+    
+    Args:
+        moves: List of [name, [x, y, z]] pairs, one per object to move
+        
+    Returns:
+        Success message with the number of objects moved
+        
+    Example:
+        Move "Cube" to (5, 0, 2) and "Sphere" to (-5, 0, 2)
+    """
+    input_model = MoveObjectsInput(moves=moves)
+    return await _run(move_objects, input_model)
+
+
+@mcp.tool()
+@_tool_errors
+async def list_objects_tool(
+    result_format: Annotated[ResultFormat, Field(alias="format")] = "text"
+) -> Union[str, List[ObjectSummary]]:
     """
     List all objects in the current Blender scene.
     
     This is useful for discovering what objects exist before performing
     operations on them. Returns object names, types, and locations.
     
+    Args:
+        result_format: (sent as "format") "text" for a readable list (default),
+            or "json" for a list of {name, type, location} objects that
+            needs no parsing
+    
     Returns:
-        Formatted list of all objects with their properties
+        Formatted list of all objects with their properties, or the
+        structured list when format is "json"
         
     Example:
         Use this to see what objects are available before moving or deleting them
     """
-    try:
-        return list_objects()
-    except Exception as e:
-        return f"Error: {str(e)}"
+    if result_format == "json":
+        return await _run(list_objects_data)
+    return await _run(list_objects)
 
 
 @mcp.tool()
+@_tool_errors
 async def delete_object_tool(name: str) -> str:
     """
     Delete an object from the Blender scene.
@@ -203,14 +275,12 @@ async def delete_object_tool(name: str) -> str:
     Example:
         Delete object "OldCube" from the scene
     """
-    try:
-        input_model = DeleteObjectInput(name=name)
-        return delete_object(input_model)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    input_model = DeleteObjectInput(name=name)
+    return await _run(delete_object, input_model)
 
 
 @mcp.tool()
+@_tool_errors
 async def select_object_tool(name: str) -> str:
     """
     Select an object by name, making it the active object.
@@ -227,14 +297,12 @@ async def select_object_tool(name: str) -> str:
     Example:
         Select object "MainCube" to prepare it for transformation
     """
-    try:
-        input_model = SelectObjectInput(name=name)
-        return select_object(input_model)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    input_model = SelectObjectInput(name=name)
+    return await _run(select_object, input_model)
 
 
 @mcp.tool()
+@_tool_errors
 async def create_material_tool(
     name: str,
     color: Tuple[float, float, float] = (0.8, 0.8, 0.8)
@@ -255,14 +323,12 @@ async def create_material_tool(
     Example:
         Create a red material: create_material_tool("RedMaterial", (1.0, 0.0, 0.0))
     """
-    try:
-        input_model = CreateMaterialInput(name=name, color=color)
-        return create_material(input_model)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    input_model = CreateMaterialInput(name=name, color=color)
+    return await _run(create_material, input_model)
 
 
 @mcp.tool()
+@_tool_errors
 async def assign_material_tool(object_name: str, material_name: str) -> str:
     """
     Assign a material to an object.
@@ -280,17 +346,15 @@ async def assign_material_tool(object_name: str, material_name: str) -> str:
     Example:
         Assign material "RedMaterial" to object "Cube"
     """
-    try:
-        input_model = AssignMaterialInput(
-            object_name=object_name,
-            material_name=material_name
-        )
-        return assign_material(input_model)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    input_model = AssignMaterialInput(
+        object_name=object_name,
+        material_name=material_name
+    )
+    return await _run(assign_material, input_model)
 
 
 @mcp.tool()
+@_tool_errors
 async def rotate_object_tool(
     name: str,
     rotation: Tuple[float, float, float]
@@ -312,14 +376,12 @@ async def rotate_object_tool(
         Rotate object "Cube" 90 degrees around Z axis: rotate_object_tool("Cube", (0, 0, 1.5708))
         (1.5708 radians ≈ 90 degrees)
     """
-    try:
-        input_model = RotateObjectInput(name=name, rotation=rotation)
-        return rotate_object(input_model)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    input_model = RotateObjectInput(name=name, rotation=rotation)
+    return await _run(rotate_object, input_model)
 
 
 @mcp.tool()
+@_tool_errors
 async def scale_object_tool(
     name: str,
     scale: Tuple[float, float, float]
@@ -341,15 +403,49 @@ async def scale_object_tool(
         Scale object "Cube" to double size: scale_object_tool("Cube", (2.0, 2.0, 2.0))
         Scale only height: scale_object_tool("Cube", (1.0, 1.0, 2.0))
     """
-    try:
-        input_model = ScaleObjectInput(name=name, scale=scale)
-        return scale_object(input_model)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    input_model = ScaleObjectInput(name=name, scale=scale)
+    return await _run(scale_object, input_model)
 
 
 @mcp.tool()
-async def get_object_info_tool(name: str) -> str:
+@_tool_errors
+async def transform_object_tool(
+    name: str,
+    location: Optional[Tuple[float, float, float]] = None,
+    rotation: Optional[Tuple[float, float, float]] = None,
+    scale: Optional[Tuple[float, float, float]] = None
+) -> str:
+    """
+    Set an object's location, rotation and/or scale in a single call.
+    
+    Use this instead of separate move/rotate/scale calls when positioning
+    an object. Anything left out stays as it is.
+    
+    Args:
+        name: Name of the object to transform (must exist in scene)
+        location: New location in 3D space [x, y, z] (optional)
+        rotation: Rotation in radians [x, y, z] - Euler angles (optional)
+        scale: Scale factors [x, y, z] - must be positive (optional)
+        
+    Returns:
+        Success message listing what was changed
+        
+    Example:
+        Place "Chair" at (2, 0, 0) turned 90 degrees around Z:
+        transform_object_tool("Chair", location=(2, 0, 0), rotation=(0, 0, 1.5708))
+    """
+    input_model = TransformObjectInput(
+        name=name, location=location, rotation=rotation, scale=scale
+    )
+    return await _run(transform_object, input_model)
+
+
+@mcp.tool()
+@_tool_errors
+async def get_object_info_tool(
+    name: str,
+    result_format: Annotated[ResultFormat, Field(alias="format")] = "text"
+) -> Union[str, ObjectInfo]:
     """
     Get detailed information about an object in the scene.
     
@@ -359,9 +455,13 @@ async def get_object_info_tool(name: str) -> str:
     
     Args:
         name: Name of the object to get information about (must exist in scene)
+        result_format: (sent as "format") "text" for a readable summary
+            (default), or "json" for an object with the same fields that
+            needs no parsing
         
     Returns:
-        Detailed multi-line string with object properties:
+        Detailed multi-line string (or, with format "json", an object) with
+        the object's properties:
         - Name and type
         - Location (x, y, z)
         - Rotation (x, y, z) in radians
@@ -371,14 +471,14 @@ async def get_object_info_tool(name: str) -> str:
     Example:
         Get info about object "MyCube" to see its current properties
     """
-    try:
-        input_model = GetObjectInfoInput(name=name)
-        return get_object_info(input_model)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    input_model = GetObjectInfoInput(name=name)
+    if result_format == "json":
+        return await _run(get_object_info_data, input_model)
+    return await _run(get_object_info, input_model)
 
 
 @mcp.tool()
+@_tool_errors
 async def create_camera_tool(
     name: str,
     location: Tuple[float, float, float] = (0.0, 0.0, 5.0),
@@ -401,21 +501,19 @@ async def create_camera_tool(
     Example:
         Create a camera named "MainCamera" at position (0, -10, 5) looking at origin
     """
-    try:
-        input_model = CreateCameraInput(
-            name=name,
-            location=location,
-            rotation=rotation
-        )
-        return create_camera(input_model)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    input_model = CreateCameraInput(
+        name=name,
+        location=location,
+        rotation=rotation
+    )
+    return await _run(create_camera, input_model)
 
 
 @mcp.tool()
+@_tool_errors
 async def create_light_tool(
     name: str,
-    light_type: str = "SUN",
+    light_type: LightType = "SUN",
     location: Tuple[float, float, float] = (0.0, 0.0, 10.0),
     energy: float = 1.0
 ) -> str:
@@ -441,19 +539,17 @@ async def create_light_tool(
         Create a sun light: create_light_tool("SunLight", "SUN", (0, 0, 10), 2.0)
         Create a point light: create_light_tool("Lamp", "POINT", (5, 5, 5), 5.0)
     """
-    try:
-        input_model = CreateLightInput(
-            name=name,
-            light_type=light_type,
-            location=location,
-            energy=energy
-        )
-        return create_light(input_model)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    input_model = CreateLightInput(
+        name=name,
+        light_type=light_type,
+        location=location,
+        energy=energy
+    )
+    return await _run(create_light, input_model)
 
 
 @mcp.tool()
+@_tool_errors
 async def render_scene_tool(
     filepath: str,
     resolution_x: int = 1920,
@@ -477,18 +573,16 @@ async def render_scene_tool(
         Render scene to PNG: render_scene_tool("/path/to/output.png", 1920, 1080)
         Render high-res: render_scene_tool("/path/to/output.png", 3840, 2160)
     """
-    try:
-        input_model = RenderSceneInput(
-            filepath=filepath,
-            resolution_x=resolution_x,
-            resolution_y=resolution_y
-        )
-        return render_scene(input_model)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    input_model = RenderSceneInput(
+        filepath=filepath,
+        resolution_x=resolution_x,
+        resolution_y=resolution_y
+    )
+    return await _run(render_scene, input_model)
 
 
 @mcp.tool()
+@_tool_errors
 async def clear_scene_tool() -> str:
     """
     Clear all objects from the current Blender scene.
@@ -497,20 +591,22 @@ async def clear_scene_tool() -> str:
     giving you a clean slate to work with. Useful for starting fresh or
     cleaning up test scenes.
     
+    Objects that other scenes also use are unlinked from this scene rather
+    than deleted, so those scenes keep them.
+    
     Returns:
-        Success message with count of deleted objects.
+        Success message with count of deleted objects (and of objects only
+        unlinked, or left in collections other scenes share, if any).
         Returns "Scene was already empty" if no objects existed.
         
     Example:
         Clear the entire scene before creating a new one
     """
-    try:
-        return clear_scene()
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return await _run(clear_scene)
 
 
 @mcp.tool()
+@_tool_errors
 async def duplicate_object_tool(
     name: str,
     new_name: str,
@@ -533,18 +629,16 @@ async def duplicate_object_tool(
     Example:
         Duplicate "Cube" as "Cube2" at position (5, 0, 0)
     """
-    try:
-        input_model = DuplicateObjectInput(
-            name=name,
-            new_name=new_name,
-            location=location
-        )
-        return duplicate_object(input_model)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    input_model = DuplicateObjectInput(
+        name=name,
+        new_name=new_name,
+        location=location
+    )
+    return await _run(duplicate_object, input_model)
 
 
 @mcp.tool()
+@_tool_errors
 async def set_active_camera_tool(camera_name: str) -> str:
     """
     Set the active camera for rendering.
@@ -562,14 +656,12 @@ async def set_active_camera_tool(camera_name: str) -> str:
     Example:
         Set "MainCamera" as the active camera for rendering
     """
-    try:
-        input_model = SetActiveCameraInput(camera_name=camera_name)
-        return set_active_camera(input_model)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    input_model = SetActiveCameraInput(camera_name=camera_name)
+    return await _run(set_active_camera, input_model)
 
 
 @mcp.tool()
+@_tool_errors
 async def create_cylinder_tool(
     name: str,
     radius: float = 1.0,
@@ -597,20 +689,45 @@ async def create_cylinder_tool(
     Example:
         Create a cylinder named "Column" with radius 0.5 and depth 3.0
     """
-    try:
-        input_model = CreateCylinderInput(
-            name=name,
-            radius=radius,
-            depth=depth,
-            location=location,
-            vertices=vertices
-        )
-        return create_cylinder(input_model)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    input_model = CreateCylinderInput(
+        name=name,
+        radius=radius,
+        depth=depth,
+        location=location,
+        vertices=vertices
+    )
+    return await _run(create_cylinder, input_model)
+
+
+@mcp.tool()
+@_tool_errors
+async def create_cylinders_tool(
+    cylinders: List[CreateCylinderInput]
+) -> str:
+    """
+    Create several cylinder primitives in a single call.
+    
+    Use this instead of repeated create_cylinder_tool calls when building
+    rows of columns, posts, pipes and the like.
+    
+    Args:
+        cylinders: List of cylinders, each an object with the same fields as
+            create_cylinder_tool: name (required), radius, depth, location,
+            vertices
+        
+    Returns:
+        Success message with the number of cylinders created
+        
+    Example:
+        Create columns "Col1" and "Col2" with radius 0.3 at (-2, 0, 1) and (2, 0, 1)
+    """
+    # Each entry arrives already validated; the models pass through as-is
+    input_model = CreateCylindersInput(cylinders=tuple(cylinders))
+    return await _run(create_cylinders, input_model)
 
 
 @mcp.tool()
+@_tool_errors
 async def create_plane_tool(
     name: str,
     size: float = 2.0,
@@ -633,18 +750,16 @@ async def create_plane_tool(
     Example:
         Create a floor plane: create_plane_tool("Floor", 10.0, (0, 0, 0))
     """
-    try:
-        input_model = CreatePlaneInput(
-            name=name,
-            size=size,
-            location=location
-        )
-        return create_plane(input_model)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    input_model = CreatePlaneInput(
+        name=name,
+        size=size,
+        location=location
+    )
+    return await _run(create_plane, input_model)
 
 
 @mcp.tool()
+@_tool_errors
 async def get_scene_filepath_tool() -> str:
     """
     Get the filepath of the current Blender file.
@@ -659,10 +774,11 @@ async def get_scene_filepath_tool() -> str:
     Example:
         Check which file is open: get_scene_filepath_tool()
     """
-    return get_scene_filepath()
+    return await _run(get_scene_filepath)
 
 
 @mcp.tool()
+@_tool_errors
 async def save_file_tool(filepath: str) -> str:
     """
     Save the current Blender scene to a .blend file.
@@ -679,14 +795,12 @@ async def save_file_tool(filepath: str) -> str:
     Example:
         Save to Desktop: save_file_tool("/Users/username/Desktop/my_scene.blend")
     """
-    try:
-        input_model = SaveFileInput(filepath=filepath)
-        return save_file(input_model)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    input_model = SaveFileInput(filepath=filepath)
+    return await _run(save_file, input_model)
 
 
 @mcp.tool()
+@_tool_errors
 async def open_file_tool(filepath: str) -> str:
     """
     Open a .blend file in Blender.
@@ -702,9 +816,98 @@ async def open_file_tool(filepath: str) -> str:
     Example:
         Open a file: open_file_tool("/Users/username/Desktop/my_scene.blend")
     """
-    try:
-        input_model = OpenFileInput(filepath=filepath)
-        return open_file(input_model)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    input_model = OpenFileInput(filepath=filepath)
+    return await _run(open_file, input_model)
+
+
+# Operations batch_execute_tool can run: op name -> (input model, operation).
+# Operations without parameters have None for the model.
+_BATCH_OPERATIONS: Dict[str, Tuple[Optional[type], Callable[..., str]]] = {
+    "create_cube": (CreateCubeInput, create_cube),
+    "create_sphere": (CreateSphereInput, create_sphere),
+    "create_cylinder": (CreateCylinderInput, create_cylinder),
+    "create_cylinders": (CreateCylindersInput, create_cylinders),
+    "create_plane": (CreatePlaneInput, create_plane),
+    "duplicate_object": (DuplicateObjectInput, duplicate_object),
+    "move_object": (MoveObjectInput, move_object),
+    "move_objects": (MoveObjectsInput, move_objects),
+    "rotate_object": (RotateObjectInput, rotate_object),
+    "scale_object": (ScaleObjectInput, scale_object),
+    "transform_object": (TransformObjectInput, transform_object),
+    "delete_object": (DeleteObjectInput, delete_object),
+    "select_object": (SelectObjectInput, select_object),
+    "list_objects": (None, list_objects),
+    "get_object_info": (GetObjectInfoInput, get_object_info),
+    "clear_scene": (None, clear_scene),
+    "set_active_camera": (SetActiveCameraInput, set_active_camera),
+    "create_material": (CreateMaterialInput, create_material),
+    "assign_material": (AssignMaterialInput, assign_material),
+    "create_camera": (CreateCameraInput, create_camera),
+    "create_light": (CreateLightInput, create_light),
+    "render_scene": (RenderSceneInput, render_scene),
+    "get_scene_filepath": (None, get_scene_filepath),
+    "save_file": (SaveFileInput, save_file),
+    "open_file": (OpenFileInput, open_file),
+}
+
 
+@mcp.tool()
+@_tool_errors
+async def batch_execute_tool(steps: List[Dict[str, Any]]) -> str:
+    """
+    Run several operations, in order, in a single call.
+    
+    Use this to build a whole scene in one round trip instead of one tool
+    call per object. Every step is validated before any of them runs, and
+    the batch stops at the first step that fails.
+    
+    Args:
+        steps: List of {"op": ..., "args": {...}} objects. "op" is a tool
+            name without the "_tool" suffix (e.g. "create_cube"), and "args"
+            holds that tool's parameters (omit it for list_objects,
+            clear_scene and get_scene_filepath)
+        
+    Returns:
+        One numbered result line per step that ran
+        
+    Example:
+        Create a cube and a sphere, then give the cube a red material:
+        [{"op": "create_cube", "args": {"name": "Box"}},
+         {"op": "create_sphere", "args": {"name": "Ball", "location": [3, 0, 0]}},
+         {"op": "create_material", "args": {"name": "Red", "color": [1, 0, 0]}},
+         {"op": "assign_material", "args": {"object_name": "Box", "material_name": "Red"}}]
+    """
+    batch = BatchInput.model_validate({"steps": steps})
+    
+    # Validate every step up front, so a typo in step 10 doesn't leave
+    # steps 1-9 applied
+    calls = []
+    for index, step in enumerate(batch.steps, 1):
+        entry = _BATCH_OPERATIONS.get(step.op)
+        if entry is None:
+            return f"Error: Step {index}: unknown operation '{step.op}'"
+        model, operation = entry
+        try:
+            if model is None:
+                if step.args:
+                    raise ValueError("this operation takes no arguments")
+                args = ()
+            else:
+                args = (model(**step.args),)
+        except Exception as e:
+            return f"Error: Step {index} ({step.op}): {str(e)}"
+        calls.append((step.op, operation, args))
+    
+    return await _run(_run_batch, calls)
+
+
+def _run_batch(calls: List[Tuple[str, Callable[..., str], tuple]]) -> str:
+    """Run validated batch steps in order, stopping at the first error"""
+    results: List[str] = []
+    for index, (op, operation, args) in enumerate(calls, 1):
+        result = operation(*args)
+        results.append(f"{index}. {op}: {result}")
+        if result.startswith("Error"):
+            results.append(f"Stopped after step {index} of {len(calls)}")
+            break
+    return "\n".join(results)
@@ -0,0 +1,64 @@
+"""Tests for the stdout filter in blender_mcp_filter.py"""
+
+import asyncio
+import json
+
+import pytest
+
+import blender_mcp_filter as flt
+
+
+@pytest.fixture(autouse=True)
+def fresh_filter_state():
+    """The filter keeps its buffer in module globals - start each test empty"""
+    flt._pending = ""
+    flt._pending_pos = 0
+    flt._discarding = False
+    flt._utf8.reset()
+
+
+def _filter(data: bytes) -> list:
+    """Run filter_stdout over data, returning the messages it forwarded"""
+    written = bytearray()
+
+    class _Out:
+        def write(self, chunk: bytes) -> None:
+            written.extend(chunk)
+
+        def flush(self) -> None:
+            pass
+
+    async def run() -> None:
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        await flt.filter_stdout(reader)
+
+    original = flt.sys.stdout
+    flt.sys.stdout = type("Stdout", (), {"buffer": _Out()})()
+    try:
+        asyncio.run(run())
+    finally:
+        flt.sys.stdout = original
+    return [json.loads(line) for line in written.decode().splitlines()]
+
+
+def test_forwards_messages_and_drops_banner():
+    data = (
+        b"Blender 4.2 (hash abc)\n"
+        b'{"jsonrpc": "2.0", "id": 1, "result": {}}\n'
+        b"Read prefs: {not json}\n"
+        b'{"jsonrpc": "2.0", "id": 2, "result": {"ok": true}}\n'
+    )
+    assert [m["id"] for m in _filter(data)] == [1, 2]
+
+
+def test_oversized_line_is_dropped_without_forwarding_nested_objects():
+    items = ",".join(f'{{"jsonrpc": "2.0", "id": {i}}}' for i in range(100, 100000))
+    oversized = '{"jsonrpc": "2.0", "id": 1, "result": {"items": [' + items + "]}}\n"
+    assert len(oversized) > flt.MAX_PENDING
+    after = '{"jsonrpc": "2.0", "id": 2, "result": {}}\n'
+
+    messages = _filter(oversized.encode() + after.encode())
+
+    assert messages == [{"jsonrpc": "2.0", "id": 2, "result": {}}]
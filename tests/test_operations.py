@@ -0,0 +1,63 @@
+"""Tests for the pure geometry helpers in src/operations.py"""
+
+import math
+
+import pytest
+
+from src.operations import _cylinder_geometry, _cylinder_uvs
+
+
+def _face_normal(verts, face):
+    """Newell normal of a polygon"""
+    nx = ny = nz = 0.0
+    for a, b in zip(face, face[1:] + face[:1]):
+        (x1, y1, z1), (x2, y2, z2) = verts[a], verts[b]
+        nx += (y1 - y2) * (z1 + z2)
+        ny += (z1 - z2) * (x1 + x2)
+        nz += (x1 - x2) * (y1 + y2)
+    return nx, ny, nz
+
+
+def test_cylinder_vertices_match_primitive_order():
+    # primitive_cylinder_add(vertices=4, radius=2, depth=4): a (bottom, top)
+    # pair per step, starting at +Y and turning towards -X
+    verts, edges, faces = _cylinder_geometry(2.0, 4.0, 4)
+
+    expected = [
+        (0.0, 2.0, -2.0), (0.0, 2.0, 2.0),
+        (-2.0, 0.0, -2.0), (-2.0, 0.0, 2.0),
+        (0.0, -2.0, -2.0), (0.0, -2.0, 2.0),
+        (2.0, 0.0, -2.0), (2.0, 0.0, 2.0),
+    ]
+    assert len(verts) == len(expected)
+    for vert, want in zip(verts, expected):
+        assert vert == pytest.approx(want, abs=1e-12)
+    assert edges == ()
+
+
+@pytest.mark.parametrize("n", [3, 5, 6, 32])
+def test_cylinder_faces_point_outwards(n):
+    verts, _, faces = _cylinder_geometry(1.0, 2.0, n)
+
+    assert len(faces) == n + 2
+    for face in faces[:n]:
+        nx, ny, nz = _face_normal(verts, face)
+        cx = sum(verts[v][0] for v in face) / 4
+        cy = sum(verts[v][1] for v in face) / 4
+        assert nx * cx + ny * cy > 0
+        assert nz == pytest.approx(0.0, abs=1e-9)
+    assert _face_normal(verts, faces[n])[2] < 0
+    assert _face_normal(verts, faces[n + 1])[2] > 0
+
+
+@pytest.mark.parametrize("n", [3, 4, 32])
+def test_cylinder_uvs_cover_every_loop(n):
+    verts, _, faces = _cylinder_geometry(1.0, 2.0, n)
+    uvs = _cylinder_uvs(n)
+
+    assert len(uvs) == 2 * sum(len(face) for face in faces)
+    assert all(0.0 <= c <= 1.0 for c in uvs)
+    # The top cap's first loop is the first ring vertex, at +Y
+    top_start = 2 * (4 * n + n)
+    assert uvs[top_start:top_start + 2] == pytest.approx((0.75, 1.0))
+    assert math.isclose(uvs[top_start + 1], 0.75 + 0.25 * verts[faces[n + 1][0]][1])